@@ -1,26 +1,63 @@
 """Command-line interface for CrediBlend."""
 
+import os
+import re
 import click
 import pandas as pd
 import numpy as np
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
-from .core.io import read_oof_files, read_sub_files, align_submission_ids, save_outputs, create_meta_json
-from .core.metrics import Scorer, compute_oof_metrics, create_methods_table
-from .core.blend import blend_predictions
-from .core.report import generate_report, export_to_pdf, create_blend_summary
-from .core.decorrelate import filter_redundant_models, get_cluster_summary
-from .core.stacking import stacking_blend
-from .core.weights import optimize_weights
-from .core.plots import create_all_plots
-from .core.stability import (compute_windowed_metrics, compute_stability_scores,
-                           detect_dominance_patterns, generate_stability_report,
-                           save_window_metrics)
-from .core.performance import (auto_strategy_selection, performance_guardrails,
-                             parallel_weight_optimization, memory_efficient_blend,
-                             get_memory_usage)
+from .core.io import (read_oof_files, read_sub_files, align_submission_ids, save_outputs,
+                      create_meta_json, write_json, IO_ENGINES, PRED_DTYPES, DEFAULT_CACHE_DIR,
+                      OUTPUT_FORMATS)
+
+
+# One `key=value` pair of --search; integers may be negative (jobs=-1)
+_SEARCH_PARAM_RE = re.compile(r'\s*(\w+)\s*=\s*(-?\d+|\w+)\s*')
+_SEARCH_INT_KEYS = ('iters', 'restarts', 'jobs')
+_SEARCH_KEYS = _SEARCH_INT_KEYS + ('backend',)
+
+# Integer keys that must be at least 1
+_SEARCH_POSITIVE_KEYS = ('iters', 'restarts')
+
+
+class SearchParamType(click.ParamType):
+    """Parses --search 'key=value,...' into a dict once, at option parsing time."""
+    
+    name = 'search'
+    
+    def convert(self, value, param, ctx):
+        if isinstance(value, dict):
+            return value
+        
+        params = {}
+        for pair in value.split(','):
+            if not pair.strip():
+                continue
+            match = _SEARCH_PARAM_RE.fullmatch(pair)
+            if match is None:
+                self.fail(f"expected key=value, got {pair!r}", param, ctx)
+            key, raw = match.groups()
+            if key not in _SEARCH_KEYS:
+                self.fail(f"unknown key {key!r}, expected one of {', '.join(_SEARCH_KEYS)}",
+                          param, ctx)
+            
+            if key == 'backend':
+                from .core.weights import SEARCH_BACKENDS
+                if raw not in SEARCH_BACKENDS:
+                    self.fail(f"backend must be one of {', '.join(SEARCH_BACKENDS)}, got {raw!r}",
+                              param, ctx)
+                params[key] = raw
+                continue
+            
+            if not raw.lstrip('-').isdigit():
+                self.fail(f"{key} must be an integer, got {raw!r}", param, ctx)
+            if key in _SEARCH_POSITIVE_KEYS and int(raw) < 1:
+                self.fail(f"{key} must be at least 1, got {raw}", param, ctx)
+            params[key] = int(raw)
+        return params
 
 
 @click.command()
@@ -35,8 +72,9 @@ from .core.performance import (auto_strategy_selection, performance_guardrails,
               help='Enable decorrelation via clustering (on/off)')
 @click.option('--stacking', type=click.Choice(['lr', 'ridge', 'none']), default='none',
               help='Enable stacking with meta-learner (lr/ridge/none)')
-@click.option('--search', default='iters=200,restarts=16',
-              help='Weight search parameters (iters=N,restarts=M)')
+@click.option('--search', type=SearchParamType(), default=None,
+              help='Weight search parameters (backend=random|optuna,iters=N,restarts=M,jobs=J); '
+                   'setting it enables weight optimization')
 @click.option('--seed', type=int, default=None,
               help='Random seed for reproducibility')
 @click.option('--time-col', default=None,
@@ -50,10 +88,23 @@ from .core.performance import (auto_strategy_selection, performance_guardrails,
 @click.option('--memory-cap', type=int, default=4096, help='Memory cap in MB')
 @click.option('--strategy', type=click.Choice(['auto', 'mean', 'weighted', 'decorrelate_weighted']), 
               default='mean', help='Blending strategy')
+@click.option('--io-engine', type=click.Choice(list(IO_ENGINES)), default='pandas',
+              help='CSV parser for OOF/submission files (pyarrow/polars fall back to pandas if not installed)')
+@click.option('--cache-dir', default=str(DEFAULT_CACHE_DIR),
+              help='Directory for the Parquet cache of parsed input files')
+@click.option('--no-cache', is_flag=True, help='Always re-parse input CSV files')
+@click.option('--dtype', type=click.Choice(list(PRED_DTYPES)), default='float32',
+              help='Floating point precision for prediction columns')
+@click.option('--no-report', is_flag=True, help='Skip the HTML report (and plots)')
+@click.option('--no-plots', is_flag=True, help='Skip rendering plots for the report')
+@click.option('--output-format', type=click.Choice(list(OUTPUT_FORMATS)), default='csv',
+              help='File format of best_submission (parquet is written with zstd)')
 def main(oof_dir: str, sub_dir: str, out_dir: str, metric: str,
          target_col: str, methods: str, decorrelate: str, stacking: str,
-         search: str, seed: int, time_col: str, freq: str, export: str, 
-         summary_json: str, n_jobs: int, memory_cap: int, strategy: str) -> None:
+         search: Optional[Dict[str, Any]], seed: int, time_col: str, freq: str, export: str, 
+         summary_json: str, n_jobs: int, memory_cap: int, strategy: str,
+         io_engine: str, cache_dir: str, no_cache: bool, dtype: str,
+         output_format: str, no_report: bool, no_plots: bool) -> None:
     """CrediBlend: Blend machine learning predictions.
     
     This tool reads OOF (out-of-fold) and submission files, computes various
@@ -74,12 +125,11 @@ def main(oof_dir: str, sub_dir: str, out_dir: str, metric: str,
     # Parse methods
     method_list = [m.strip() for m in methods.split(',')]
     
-    # Parse search parameters
-    search_params = {}
-    for param in search.split(','):
-        if '=' in param:
-            key, value = param.split('=')
-            search_params[key.strip()] = int(value.strip())
+    # Parse search parameters (weight optimization is opt-in: --search or the 'weighted' method)
+    search_params = dict(search or {})
+    
+    # Parquet cache of parsed inputs (None disables it)
+    input_cache_dir = None if no_cache else cache_dir
     
     # Configuration
     config = {
@@ -98,26 +148,47 @@ def main(oof_dir: str, sub_dir: str, out_dir: str, metric: str,
         'n_jobs': n_jobs,
         'memory_cap': memory_cap,
         'strategy': strategy,
+        'io_engine': io_engine,
+        'dtype': dtype,
         'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     }
     
+    # Plots are only ever rendered to PNG; skip GUI backend setup unless the user chose one
+    os.environ.setdefault('MPLBACKEND', 'Agg')
+    
+    # Plots only feed the report
+    render_plots = not (no_report or no_plots)
+    
     try:
+        # Heavier modules (sklearn, matplotlib, ...) are imported where they are
+        # first needed so `--help` and simple runs don't pay for them
+        from .core.metrics import Scorer, compute_oof_metrics, create_methods_table
+        from .core.blend import blend_predictions, stack_predictions
+        from .core.performance import (auto_strategy_selection, performance_guardrails,
+                                     get_memory_usage)
+        
         # Initialize scorer
         scorer = Scorer(metric=metric)
         print(f"Using metric: {metric}")
         
         # Read OOF files
         print(f"\n📁 Reading OOF files from: {oof_dir}")
-        oof_files = read_oof_files(oof_dir, time_col)
+        oof_files = read_oof_files(oof_dir, time_col, engine=io_engine, n_jobs=n_jobs,
+                                   cache_dir=input_cache_dir, dtype=dtype,
+                                   target_col=target_col)
         
         # Read submission files
         print(f"\n📁 Reading submission files from: {sub_dir}")
-        sub_files = read_sub_files(sub_dir)
+        sub_files = read_sub_files(sub_dir, engine=io_engine, n_jobs=n_jobs,
+                                   cache_dir=input_cache_dir, dtype=dtype)
         
         # Apply performance guardrails
         print(f"\n🛡️  Applying performance guardrails...")
-        oof_files = performance_guardrails(oof_files, memory_cap, max_models=20)
-        sub_files = performance_guardrails(sub_files, memory_cap, max_models=20)
+        optimize_dtypes = dtype == 'float32'
+        oof_files = performance_guardrails(oof_files, memory_cap, max_models=20,
+                                           optimize=optimize_dtypes)
+        sub_files = performance_guardrails(sub_files, memory_cap, max_models=20,
+                                           optimize=optimize_dtypes)
         
         print(f"Memory usage: {get_memory_usage():.1f}MB")
         
@@ -125,6 +196,9 @@ def main(oof_dir: str, sub_dir: str, out_dir: str, metric: str,
         print(f"\n🔗 Aligning submission IDs...")
         aligned_sub_files = align_submission_ids(sub_files)
         
+        # Stack aligned predictions into a single (n_samples, n_models) matrix
+        sub_tensors = stack_predictions(aligned_sub_files)
+        
         # Compute OOF metrics
         print(f"\n📊 Computing OOF metrics...")
         oof_metrics = compute_oof_metrics(oof_files, scorer, target_col)
@@ -134,6 +208,7 @@ def main(oof_dir: str, sub_dir: str, out_dir: str, metric: str,
         cluster_summary = pd.DataFrame()
         if config['decorrelate']:
             print(f"\n🔍 Applying decorrelation...")
+            from .core.decorrelate import filter_redundant_models, get_cluster_summary
             filtered_oof_files, filtered_metrics, decorrelation_info = filter_redundant_models(
                 oof_files, oof_metrics, target_col, correlation_threshold=0.8
             )
@@ -167,12 +242,13 @@ def main(oof_dir: str, sub_dir: str, out_dir: str, metric: str,
                 method_list = ['mean']
         
         print(f"\n🔄 Applying blending methods: {', '.join(method_list)}")
-        blend_results = blend_predictions(aligned_sub_files, oof_metrics, method_list)
+        blend_results = blend_predictions(sub_tensors, oof_metrics, method_list)
         
         # Apply stacking if enabled
         stacking_info: Dict[str, Any] = {}
         if config['stacking'] != 'none':
             print(f"\n📚 Applying stacking with {config['stacking']}...")
+            from .core.stacking import stacking_blend
             try:
                 stacking_result, stacking_info = stacking_blend(
                     oof_files, aligned_sub_files, 
@@ -186,38 +262,46 @@ def main(oof_dir: str, sub_dir: str, out_dir: str, metric: str,
         
         # Apply weight optimization
         weight_info: Dict[str, Any] = {}
-        if 'weighted' in method_list or config['search_params']:
+        if 'weighted' in method_list or search is not None:
             print(f"\n⚖️  Applying weight optimization...")
+            from .core.weights import optimize_weights
+            from .core.performance import parallel_weight_optimization
             try:
                 n_restarts = config['search_params'].get('restarts', 16)
-                if n_jobs != 1:
-                    print(f"Using parallel optimization with {n_jobs} jobs...")
+                search_jobs = config['search_params'].get('jobs', n_jobs)
+                search_backend = config['search_params'].get('backend', 'random')
+                n_iters = config['search_params'].get('iters', 200)
+                if search_jobs != 1:
+                    print(f"Using parallel optimization with {search_jobs} jobs...")
                     weights, best_score, weight_info = parallel_weight_optimization(
                         oof_files, aligned_sub_files, scorer, target_col,
-                        n_restarts, n_jobs
+                        n_restarts, search_jobs, random_state=seed,
+                        backend=search_backend, n_iters=n_iters
                     )
                     # Create weighted blend result
                     if weights:
-                        weighted_pred = np.zeros(len(aligned_sub_files[list(aligned_sub_files.keys())[0]]))
+                        sub_model_names = sub_tensors.model_names
+                        weight_vector = np.zeros(len(sub_model_names))
                         for model_name, weight in weights.items():
-                            # Map model names from oof_files to aligned_sub_files
-                            if model_name in aligned_sub_files:
-                                weighted_pred += weight * aligned_sub_files[model_name]['pred'].values
+                            # Map model names from oof_files to submission matrix columns
+                            if model_name in sub_model_names:
+                                weight_vector[sub_model_names.index(model_name)] += weight
                             else:
                                 # Try to find matching model by removing prefixes
-                                for sub_name in aligned_sub_files.keys():
+                                for i, sub_name in enumerate(sub_model_names):
                                     if model_name.replace('oof_', 'sub_') == sub_name or \
                                        model_name.replace('model_', 'sub_model') == sub_name:
-                                        weighted_pred += weight * aligned_sub_files[sub_name]['pred'].values
+                                        weight_vector[i] += weight
                                         break
                         blend_results['weighted'] = pd.DataFrame({
-                            'id': aligned_sub_files[list(aligned_sub_files.keys())[0]]['id'].values,
-                            'pred': weighted_pred
+                            'id': sub_tensors.ids,
+                            'pred': sub_tensors.pred_matrix @ weight_vector
                         })
                 else:
                     weight_result, weight_info = optimize_weights(
                         oof_files, aligned_sub_files, scorer,
-                        target_col=target_col, n_restarts=n_restarts, random_state=seed
+                        target_col=target_col, n_restarts=n_restarts, max_workers=1,
+                        random_state=seed, backend=search_backend, n_iters=n_iters
                     )
                     blend_results['weighted'] = weight_result
             except Exception as e:
@@ -236,6 +320,9 @@ def main(oof_dir: str, sub_dir: str, out_dir: str, metric: str,
         window_metrics = pd.DataFrame()
         if time_col:
             print(f"\n⏰ Performing time-sliced analysis...")
+            from .core.stability import (compute_windowed_metrics, compute_stability_scores,
+                                       detect_dominance_patterns, generate_stability_report,
+                                       save_window_metrics)
             try:
                 # Compute windowed metrics
                 window_metrics = compute_windowed_metrics(
@@ -251,7 +338,8 @@ def main(oof_dir: str, sub_dir: str, out_dir: str, metric: str,
                     
                     # Generate stability report
                     stability_report = generate_stability_report(
-                        window_metrics, stability_scores, dominance_analysis
+                        window_metrics, stability_scores, dominance_analysis,
+                        include_plots=render_plots
                     )
                     
                     # Save window metrics
@@ -265,35 +353,42 @@ def main(oof_dir: str, sub_dir: str, out_dir: str, metric: str,
                 stability_report = {}
 
         # Create visualizations
-        print(f"\n📊 Creating visualizations...")
-        plots = create_all_plots(
-            decorrelation_info.get('correlation_matrix', pd.DataFrame()),
-            weight_info.get('weights', {}),
-            methods_df,
-            cluster_summary,
-            blend_results
-        )
-        
-        # Add stability plots if available
-        if stability_report.get('plots'):
-            plots.update(stability_report['plots'])
+        plots = {}
+        if render_plots:
+            print(f"\n📊 Creating visualizations...")
+            from .core.plots import create_all_plots
+            plots = create_all_plots(
+                decorrelation_info.get('correlation_matrix', pd.DataFrame()),
+                weight_info.get('weights', {}),
+                methods_df,
+                cluster_summary,
+                blend_results
+            )
+            
+            # Add stability plots if available
+            if stability_report.get('plots'):
+                plots.update(stability_report['plots'])
         
         # Generate HTML report
-        print(f"\n📄 Generating HTML report...")
-        report_html = generate_report(
-            oof_metrics, methods_df, blend_results, config,
-            decorrelation_info=decorrelation_info,
-            cluster_summary=cluster_summary,
-            stacking_info=stacking_info,
-            weight_info=weight_info,
-            plots=plots,
-            stability_report=stability_report,
-            window_metrics=window_metrics
-        )
+        report_html = None
+        if not no_report:
+            print(f"\n📄 Generating HTML report...")
+            from .core.report import generate_report
+            report_html = generate_report(
+                oof_metrics, methods_df, blend_results, config,
+                decorrelation_info=decorrelation_info,
+                cluster_summary=cluster_summary,
+                stacking_info=stacking_info,
+                weight_info=weight_info,
+                plots=plots,
+                stability_report=stability_report,
+                window_metrics=window_metrics
+            )
         
         # Save outputs
         print(f"\n💾 Saving outputs to: {out_dir}")
-        save_outputs(out_dir, best_submission, methods_df, report_html)
+        submission_path = save_outputs(out_dir, best_submission, methods_df, report_html,
+                                       fmt=output_format)
         
         # Create meta.json
         args_dict = {
@@ -309,7 +404,11 @@ def main(oof_dir: str, sub_dir: str, out_dir: str, metric: str,
             'time_col': time_col,
             'freq': freq,
             'export': export,
-            'summary_json': summary_json
+            'summary_json': summary_json,
+            'io_engine': io_engine,
+            'cache_dir': input_cache_dir,
+            'dtype': dtype,
+            'output_format': output_format
         }
         create_meta_json(args_dict, seed, list(oof_files.keys()), list(sub_files.keys()), out_dir)
         
@@ -318,40 +417,25 @@ def main(oof_dir: str, sub_dir: str, out_dir: str, metric: str,
         
         # Save weights if available
         if weight_info.get('weights'):
-            import json
-            with open(output_path / "weights.json", "w") as f:
-                json.dump(weight_info, f, indent=2)
+            write_json(weight_info, output_path / "weights.json")
             print(f"Saved weights: {output_path / 'weights.json'}")
         
         # Save stacking coefficients if available
         if stacking_info.get('coefficients'):
-            import json
-            with open(output_path / "stacking_coefficients.json", "w") as f:
-                json.dump(stacking_info, f, indent=2)
+            write_json(stacking_info, output_path / "stacking_coefficients.json")
             print(f"Saved stacking coefficients: {output_path / 'stacking_coefficients.json'}")
         
         # Save decorrelation info if available
         if decorrelation_info:
-            import json
-            # Convert numpy arrays to lists for JSON serialization
-            serializable_info = {}
-            for key, value in decorrelation_info.items():
-                if isinstance(value, pd.DataFrame):
-                    serializable_info[key] = value.to_dict('records')
-                elif isinstance(value, np.ndarray):
-                    serializable_info[key] = value.tolist()
-                elif isinstance(value, (np.integer, np.floating)):
-                    serializable_info[key] = value.item()
-                else:
-                    serializable_info[key] = value
-            
-            with open(output_path / "decorrelation_info.json", "w") as f:
-                json.dump(serializable_info, f, indent=2)
+            write_json(decorrelation_info, output_path / "decorrelation_info.json")
             print(f"Saved decorrelation info: {output_path / 'decorrelation_info.json'}")
         
         # Export PDF if requested
-        if export == 'pdf':
+        if export == 'pdf' and report_html is None:
+            print("PDF export skipped: --no-report was given")
+        elif export == 'pdf':
             print(f"\n📄 Exporting PDF report...")
+            from .core.report import export_to_pdf
             pdf_path = output_path / "report.pdf"
             if export_to_pdf(report_html, str(pdf_path)):
                 print(f"Saved PDF report: {pdf_path}")
@@ -361,17 +445,17 @@ def main(oof_dir: str, sub_dir: str, out_dir: str, metric: str,
         # Create blend summary JSON
         if summary_json:
             print(f"\n📊 Creating blend summary...")
-            import json
+            from .core.report import create_blend_summary
             blend_summary = create_blend_summary(methods_df, weight_info, stacking_info, blend_results)
-            with open(summary_json, "w") as f:
-                json.dump(blend_summary, f, indent=2)
+            write_json(blend_summary, summary_json)
             print(f"Saved blend summary: {summary_json}")
         
         # Print summary
         print(f"\n✅ Success! Generated:")
-        print(f"   • best_submission.csv ({len(best_submission)} predictions)")
+        print(f"   • {submission_path.name} ({len(best_submission)} predictions)")
         print(f"   • methods.csv ({len(methods_df)} models)")
-        print(f"   • report.html")
+        if report_html is not None:
+            print(f"   • report.html")
         
         # Determine exit code based on results
         exit_code = 0  # Default: success
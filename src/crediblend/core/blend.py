@@ -2,38 +2,130 @@
 
 import numpy as np
 import pandas as pd
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 from scipy.special import expit, logit
+from scipy.stats import rankdata
 
 
-def mean_blend(sub_files: Dict[str, pd.DataFrame]) -> pd.DataFrame:
-    """Simple mean blending of predictions.
+@dataclass
+class BlendTensors:
+    """Aligned submission predictions stacked into one matrix.
+    
+    Transformed copies of the matrix (ranks, logits) are computed on first use
+    and cached, so every blend that needs the same space shares one transform.
+    """
+    pred_matrix: np.ndarray
+    ids: np.ndarray
+    model_names: List[str]
+    _spaces: Dict[str, np.ndarray] = field(default_factory=dict, repr=False)
+    
+    @property
+    def n_models(self) -> int:
+        """Number of stacked models."""
+        return self.pred_matrix.shape[1]
+    
+    def space(self, name: str) -> np.ndarray:
+        """Prediction matrix in the given space ('raw', 'rank' or 'logit')."""
+        if name not in self._spaces:
+            self._spaces[name] = _SPACE_TRANSFORMS[name](self.pred_matrix)
+        return self._spaces[name]
+
+
+def stack_predictions(sub_files: Dict[str, pd.DataFrame]) -> BlendTensors:
+    """Stack aligned submission predictions into a single matrix.
     
     Args:
-        sub_files: Dictionary of submission DataFrames with columns [id, pred]
+        sub_files: Dictionary of aligned submission DataFrames with columns [id, pred]
         
     Returns:
-        DataFrame with mean predictions
+        BlendTensors with the (n_samples, n_models) prediction matrix, ids and model names
     """
     if not sub_files:
         raise ValueError("No submission files provided for blending")
     
-    # Get the first file to use as base
-    first_name, first_df = next(iter(sub_files.items()))
-    result = first_df[['id']].copy()
-    
-    # Collect all predictions
-    pred_arrays = []
-    for name, df in sub_files.items():
-        pred_arrays.append(df['pred'].values)
+    model_names = list(sub_files.keys())
+    ids = sub_files[model_names[0]]['id'].to_numpy()
+    pred_matrix = np.column_stack([sub_files[name]['pred'].to_numpy() for name in model_names])
     
-    # Compute mean
-    pred_matrix = np.column_stack(pred_arrays)
-    mean_pred = np.mean(pred_matrix, axis=1)
+    return BlendTensors(pred_matrix, ids, model_names)
+
+
+def _raw_space(pred_matrix: np.ndarray) -> np.ndarray:
+    """Identity transform for probability-space blends."""
+    return pred_matrix
+
+
+def _rank_space(pred_matrix: np.ndarray) -> np.ndarray:
+    """Per-model ranks (higher prediction = higher rank)."""
+    return rankdata(pred_matrix, axis=0)
+
+
+def _logit_space(pred_matrix: np.ndarray) -> np.ndarray:
+    """Per-model logits, clamped to avoid infinities."""
+    return logit(np.clip(pred_matrix, 1e-7, 1 - 1e-7))
+
+
+def _rank_to_pred(mean_ranks: np.ndarray) -> np.ndarray:
+    """Normalize mean ranks back to [0, 1]."""
+    n_samples = len(mean_ranks)
+    return (mean_ranks - 1) / (n_samples - 1)
+
+
+def _identity(pred: np.ndarray) -> np.ndarray:
+    """Identity inverse transform."""
+    return pred
+
+
+# Every simple blend is a uniform average taken in some transformed space:
+# method -> (space name, inverse transform applied to the averaged column)
+_BLEND_SPACES = {
+    "mean": ("raw", _identity),
+    # Uniform placeholder; optimized weights are applied by the caller
+    "weighted": ("raw", _identity),
+    "rank_mean": ("rank", _rank_to_pred),
+    "logit_mean": ("logit", expit),
+}
+
+_SPACE_TRANSFORMS = {
+    "raw": _raw_space,
+    "rank": _rank_space,
+    "logit": _logit_space,
+}
+
+
+def uniform_weights(n_models: int, n_blends: int = 1, dtype=np.float64) -> np.ndarray:
+    """Weight matrix whose columns each average all models equally.
     
-    result['pred'] = mean_pred
+    Args:
+        n_models: Number of models (rows)
+        n_blends: Number of blends to compute at once (columns)
+        dtype: Weight dtype, match the prediction matrix to avoid upcasting
+        
+    Returns:
+        Weight matrix (n_models, n_blends)
+    """
+    return np.full((n_models, n_blends), 1.0 / n_models, dtype=dtype)
+
+
+def _space_blend(tensors: BlendTensors, space: str) -> np.ndarray:
+    """Uniform blend of the prediction matrix taken in the given space."""
+    space_matrix = tensors.space(space)
+    weights = uniform_weights(tensors.n_models, dtype=space_matrix.dtype)
+    return (space_matrix @ weights)[:, 0]
+
+
+def mean_blend(sub_files: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """Simple mean blending of predictions.
     
-    return result
+    Args:
+        sub_files: Dictionary of submission DataFrames with columns [id, pred]
+        
+    Returns:
+        DataFrame with mean predictions
+    """
+    tensors = stack_predictions(sub_files)
+    return pd.DataFrame({'id': tensors.ids, 'pred': _space_blend(tensors, "raw")})
 
 
 def rank_mean_blend(sub_files: Dict[str, pd.DataFrame]) -> pd.DataFrame:
@@ -45,31 +137,8 @@ def rank_mean_blend(sub_files: Dict[str, pd.DataFrame]) -> pd.DataFrame:
     Returns:
         DataFrame with rank-mean predictions
     """
-    if not sub_files:
-        raise ValueError("No submission files provided for blending")
-    
-    # Get the first file to use as base
-    first_name, first_df = next(iter(sub_files.items()))
-    result = first_df[['id']].copy()
-    
-    # Collect all predictions and convert to ranks
-    rank_arrays = []
-    for name, df in sub_files.items():
-        # Convert to ranks (higher prediction = higher rank)
-        ranks = df['pred'].rank(method='average')
-        rank_arrays.append(ranks.values)
-    
-    # Compute mean of ranks
-    rank_matrix = np.column_stack(rank_arrays)
-    mean_ranks = np.mean(rank_matrix, axis=1)
-    
-    # Convert back to predictions by normalizing ranks to [0, 1]
-    n_samples = len(result)
-    normalized_pred = (mean_ranks - 1) / (n_samples - 1)
-    
-    result['pred'] = normalized_pred
-    
-    return result
+    tensors = stack_predictions(sub_files)
+    return pd.DataFrame({'id': tensors.ids, 'pred': _rank_to_pred(_space_blend(tensors, "rank"))})
 
 
 def logit_mean_blend(sub_files: Dict[str, pd.DataFrame]) -> pd.DataFrame:
@@ -81,38 +150,35 @@ def logit_mean_blend(sub_files: Dict[str, pd.DataFrame]) -> pd.DataFrame:
     Returns:
         DataFrame with logit-mean predictions
     """
-    if not sub_files:
-        raise ValueError("No submission files provided for blending")
-    
-    # Get the first file to use as base
-    first_name, first_df = next(iter(sub_files.items()))
-    result = first_df[['id']].copy()
-    
-    # Collect all predictions and convert to logits
-    logit_arrays = []
-    for name, df in sub_files.items():
-        preds = df['pred'].values
-        
-        # Clamp predictions to avoid logit issues
-        preds = np.clip(preds, 1e-7, 1 - 1e-7)
-        
-        # Convert to logits
-        logits = logit(preds)
-        logit_arrays.append(logits)
-    
-    # Compute mean of logits
-    logit_matrix = np.column_stack(logit_arrays)
-    mean_logits = np.mean(logit_matrix, axis=1)
+    tensors = stack_predictions(sub_files)
+    return pd.DataFrame({'id': tensors.ids, 'pred': expit(_space_blend(tensors, "logit"))})
+
+
+def _select_best_model(model_names: List[str],
+                       oof_metrics: Dict[str, Dict[str, float]],
+                       method: str = "overall_oof") -> str:
+    """Select the best model among model_names based on OOF metrics."""
+    best_model = None
+    best_score = -np.inf
     
-    # Convert back to probabilities
-    mean_probs = expit(mean_logits)
+    for model_name, metrics in oof_metrics.items():
+        if model_name in model_names:
+            score = metrics.get(method, -np.inf)
+            if not np.isnan(score) and score > best_score:
+                best_score = score
+                best_model = model_name
     
-    result['pred'] = mean_probs
+    if best_model is None:
+        # Fallback to first available model
+        best_model = model_names[0]
+        print(f"Warning: No valid OOF metrics found, using first model: {best_model}")
+    else:
+        print(f"Best model based on {method}: {best_model} (score: {best_score:.4f})")
     
-    return result
+    return best_model
 
 
-def get_best_blend(sub_files: Dict[str, pd.DataFrame], 
+def get_best_blend(sub_files: Dict[str, pd.DataFrame],
                    oof_metrics: Dict[str, Dict[str, float]],
                    method: str = "overall_oof") -> pd.DataFrame:
     """Get the best single model prediction based on OOF metrics.
@@ -128,34 +194,18 @@ def get_best_blend(sub_files: Dict[str, pd.DataFrame],
     if not sub_files:
         raise ValueError("No submission files provided")
     
-    # Find best model
-    best_model = None
-    best_score = -np.inf
-    
-    for model_name, metrics in oof_metrics.items():
-        if model_name in sub_files:
-            score = metrics.get(method, -np.inf)
-            if not np.isnan(score) and score > best_score:
-                best_score = score
-                best_model = model_name
-    
-    if best_model is None:
-        # Fallback to first available model
-        best_model = list(sub_files.keys())[0]
-        print(f"Warning: No valid OOF metrics found, using first model: {best_model}")
-    else:
-        print(f"Best model based on {method}: {best_model} (score: {best_score:.4f})")
+    best_model = _select_best_model(list(sub_files.keys()), oof_metrics, method)
     
     return sub_files[best_model].copy()
 
 
-def blend_predictions(sub_files: Dict[str, pd.DataFrame],
+def blend_predictions(tensors: BlendTensors,
                      oof_metrics: Dict[str, Dict[str, float]],
                      methods: Optional[List[str]] = None) -> Dict[str, pd.DataFrame]:
     """Apply multiple blending methods.
     
     Args:
-        sub_files: Dictionary of submission DataFrames
+        tensors: Stacked submission predictions, see stack_predictions
         oof_metrics: OOF metrics dictionary
         methods: List of blending methods to apply
         
@@ -165,25 +215,37 @@ def blend_predictions(sub_files: Dict[str, pd.DataFrame],
     if methods is None:
         methods = ["mean", "rank_mean", "logit_mean", "best_single"]
     
+    if tensors.n_models == 0:
+        raise ValueError("No submission files provided for blending")
+    
+    # Transform once per space and compute all of its blends in one matmul
+    space_methods = {}
+    for method in methods:
+        if method in _BLEND_SPACES:
+            space_methods.setdefault(_BLEND_SPACES[method][0], []).append(method)
+    
+    space_preds = {}
+    for space, space_method_list in space_methods.items():
+        space_matrix = tensors.space(space)
+        weights = uniform_weights(tensors.n_models, len(space_method_list), space_matrix.dtype)
+        blends = space_matrix @ weights
+        for j, method in enumerate(space_method_list):
+            space_preds[method] = _BLEND_SPACES[method][1](blends[:, j])
+    
     results = {}
     
     for method in methods:
-        if method == "mean":
-            results[method] = mean_blend(sub_files)
-        elif method == "rank_mean":
-            results[method] = rank_mean_blend(sub_files)
-        elif method == "logit_mean":
-            results[method] = logit_mean_blend(sub_files)
-        elif method == "weighted":
-            # For weighted blending, we'll use mean as fallback
-            # The actual weighted blending is handled separately
-            results[method] = mean_blend(sub_files)
+        if method in space_preds:
+            pred = space_preds[method]
         elif method == "best_single":
-            results[method] = get_best_blend(sub_files, oof_metrics)
+            best_model = _select_best_model(tensors.model_names, oof_metrics)
+            pred = tensors.pred_matrix[:, tensors.model_names.index(best_model)]
         else:
             print(f"Warning: Unknown blending method: {method}")
             continue
         
+        results[method] = pd.DataFrame({'id': tensors.ids, 'pred': pred})
+        
         print(f"Computed {method} blend: {len(results[method])} predictions")
     
     return results
@@ -4,11 +4,35 @@ import numpy as np
 import pandas as pd
 from scipy.cluster.hierarchy import linkage, fcluster
 from scipy.spatial.distance import pdist, squareform
-from scipy.stats import spearmanr
+from scipy.stats import rankdata
 from typing import Dict, List, Tuple, Optional
 import warnings
 
 
+def spearman_corr_matrix(pred_matrix: np.ndarray) -> np.ndarray:
+    """Spearman correlation between all columns of a prediction matrix.
+    
+    Ranks each column, standardizes the ranks and takes one X.T @ X product,
+    which is the Pearson correlation of the ranks.
+    
+    Args:
+        pred_matrix: Prediction matrix (n_samples, n_models)
+        
+    Returns:
+        Correlation matrix (n_models, n_models); NaN for constant columns
+    """
+    ranks = rankdata(pred_matrix, axis=0)
+    ranks -= ranks.mean(axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ranks /= np.sqrt((ranks * ranks).sum(axis=0))
+        corr_matrix = ranks.T @ ranks
+    
+    np.clip(corr_matrix, -1.0, 1.0, out=corr_matrix)
+    np.fill_diagonal(corr_matrix, 1.0)
+    
+    return corr_matrix
+
+
 def compute_correlation_matrix(oof_data: Dict[str, pd.DataFrame], 
                               target_col: str = "target") -> pd.DataFrame:
     """Compute Spearman correlation matrix of OOF predictions.
@@ -35,18 +59,8 @@ def compute_correlation_matrix(oof_data: Dict[str, pd.DataFrame],
     
     # Compute correlation matrix
     model_names = list(pred_data.keys())
-    n_models = len(model_names)
-    corr_matrix = np.eye(n_models)
-    
-    for i in range(n_models):
-        for j in range(i + 1, n_models):
-            pred_i = pred_data[model_names[i]]
-            pred_j = pred_data[model_names[j]]
-            
-            # Compute Spearman correlation
-            corr, _ = spearmanr(pred_i, pred_j)
-            corr_matrix[i, j] = corr
-            corr_matrix[j, i] = corr
+    pred_matrix = np.column_stack([pred_data[name] for name in model_names])
+    corr_matrix = spearman_corr_matrix(pred_matrix)
     
     # Create DataFrame
     corr_df = pd.DataFrame(corr_matrix, index=model_names, columns=model_names)
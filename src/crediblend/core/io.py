@@ -1,15 +1,45 @@
 """I/O utilities for reading OOF and submission files."""
 
 import os
+import csv
+import hashlib
+import threading
 import pandas as pd
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any, Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, reduce
 import warnings
 import json
 import numpy as np
 from datetime import datetime
 
 
+# CSV parsers supported by read_oof_files/read_sub_files
+IO_ENGINES = ('pandas', 'pyarrow', 'polars')
+
+# Block size handed to the PyArrow CSV reader (bytes per parallel parse chunk)
+_PYARROW_BLOCK_SIZE = 8 << 20
+
+# Files at least this large are memory-mapped instead of read through a buffer
+_MMAP_THRESHOLD = 512 << 20
+
+# Floating point dtypes supported for prediction columns
+PRED_DTYPES = ('float32', 'float64')
+
+# Default location of the Parquet cache of parsed CSV files
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'crediblend'
+
+# Formats supported for best_submission output
+OUTPUT_FORMATS = ('csv', 'parquet')
+
+# Rows per Parquet row group when writing the submission
+_PARQUET_ROW_GROUP_SIZE = 64_000
+
+# Write buffer for report.html, large enough for reports with inline plots
+_REPORT_WRITE_BUFFER = 1 << 20
+
+
 def validate_oof_schema(df: pd.DataFrame, filename: str, time_col: Optional[str] = None) -> None:
     """Validate OOF file schema.
     
@@ -21,9 +51,12 @@ def validate_oof_schema(df: pd.DataFrame, filename: str, time_col: Optional[str]
     Raises:
         ValueError: If schema validation fails
     """
+    # Column names as a set once; every presence check below is a set lookup
+    present_cols = set(df.columns)
+    
     # Required columns
     required_cols = ['id', 'pred']
-    missing_cols = [col for col in required_cols if col not in df.columns]
+    missing_cols = [col for col in required_cols if col not in present_cols]
     if missing_cols:
         raise ValueError(f"OOF file {filename} missing required columns: {missing_cols}")
     
@@ -34,7 +67,7 @@ def validate_oof_schema(df: pd.DataFrame, filename: str, time_col: Optional[str]
     
     # Check for unexpected columns
     expected_cols = set(required_cols + optional_cols)
-    unexpected_cols = set(df.columns) - expected_cols
+    unexpected_cols = present_cols - expected_cols
     if unexpected_cols:
         warnings.warn(f"OOF file {filename} has unexpected columns: {unexpected_cols}")
     
@@ -53,21 +86,21 @@ def validate_oof_schema(df: pd.DataFrame, filename: str, time_col: Optional[str]
         raise ValueError(f"OOF file {filename} has missing values in 'pred' column")
     
     # Validate fold column if present
-    if 'fold' in df.columns:
+    if 'fold' in present_cols:
         if not pd.api.types.is_numeric_dtype(df['fold']):
             raise ValueError(f"OOF file {filename} 'fold' column must be numeric")
         if df['fold'].isna().any():
             raise ValueError(f"OOF file {filename} has missing values in 'fold' column")
     
     # Validate target column if present
-    if 'target' in df.columns:
+    if 'target' in present_cols:
         if not pd.api.types.is_numeric_dtype(df['target']):
             raise ValueError(f"OOF file {filename} 'target' column must be numeric")
         if df['target'].isna().any():
             raise ValueError(f"OOF file {filename} has missing values in 'target' column")
     
     # Validate time column if present
-    if time_col and time_col in df.columns:
+    if time_col and time_col in present_cols:
         try:
             pd.to_datetime(df[time_col])
         except Exception as e:
@@ -84,15 +117,17 @@ def validate_sub_schema(df: pd.DataFrame, filename: str) -> None:
     Raises:
         ValueError: If schema validation fails
     """
+    present_cols = set(df.columns)
+    
     # Required columns
     required_cols = ['id', 'pred']
-    missing_cols = [col for col in required_cols if col not in df.columns]
+    missing_cols = [col for col in required_cols if col not in present_cols]
     if missing_cols:
         raise ValueError(f"Submission file {filename} missing required columns: {missing_cols}")
     
     # Check for unexpected columns
     expected_cols = set(required_cols)
-    unexpected_cols = set(df.columns) - expected_cols
+    unexpected_cols = present_cols - expected_cols
     if unexpected_cols:
         warnings.warn(f"Submission file {filename} has unexpected columns: {unexpected_cols}")
     
@@ -144,21 +179,332 @@ def create_meta_json(args: Dict[str, Any], seed: Optional[int],
     }
     
     meta_path = Path(output_dir) / 'meta.json'
-    with open(meta_path, 'w') as f:
-        json.dump(meta, f, indent=2, default=str)
+    write_json(meta, meta_path, default=str)
     
     print(f"Saved metadata: {meta_path}")
 
 
-def read_oof_files(oof_dir: str, time_col: Optional[str] = None) -> Dict[str, pd.DataFrame]:
+def downcast_predictions(df: pd.DataFrame, dtype: str = 'float32',
+                         exclude: Tuple[str, ...] = ('id', 'target')) -> pd.DataFrame:
+    """Cast floating point columns to the requested precision in place.
+    
+    Prediction columns do not need float64; float32 halves memory and
+    bandwidth for every downstream blending pass.
+    
+    Args:
+        df: DataFrame to convert
+        dtype: Target floating point dtype ('float32' or 'float64')
+        exclude: Columns left untouched (ids and targets)
+        
+    Returns:
+        The same DataFrame with converted columns
+    """
+    for col in df.columns:
+        if col not in exclude and pd.api.types.is_float_dtype(df[col]) and df[col].dtype != dtype:
+            df[col] = df[col].astype(dtype)
+    
+    return df
+
+
+def _csv_header(file_path: Path) -> List[str]:
+    """Column names from the first line of a CSV file (a UTF-8 BOM is stripped)."""
+    with open(file_path, newline='', encoding='utf-8-sig') as f:
+        return next(csv.reader(f), [])
+
+
+def _read_csv_pyarrow(file_path: Path, dtype: str = 'float64',
+                      columns: Optional[Tuple[str, ...]] = None) -> pd.DataFrame:
+    """Read a CSV file with the multithreaded PyArrow parser.
+    
+    Args:
+        file_path: Path to CSV file
+        dtype: Floating point dtype the 'pred' column is parsed into
+        columns: Columns to keep (missing ones are ignored); None keeps all
+        
+    Returns:
+        DataFrame with the file contents
+    """
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+    
+    include_columns = None
+    if columns is not None:
+        # include_columns must only name columns that exist, so probe the header first
+        include_columns = [col for col in _csv_header(file_path) if col in columns]
+    
+    read_options = pacsv.ReadOptions(use_threads=True, block_size=_PYARROW_BLOCK_SIZE)
+    convert_options = pacsv.ConvertOptions(column_types={'pred': pa.from_numpy_dtype(np.dtype(dtype))},
+                                           include_columns=include_columns)
+    
+    if file_path.stat().st_size >= _MMAP_THRESHOLD:
+        # Let the OS page the file in instead of copying it into a read buffer
+        with pa.memory_map(str(file_path), 'r') as source:
+            table = pacsv.read_csv(source, read_options=read_options, convert_options=convert_options)
+    else:
+        table = pacsv.read_csv(file_path, read_options=read_options, convert_options=convert_options)
+    
+    # Release Arrow buffers column by column while converting to cut peak memory;
+    # split_blocks keeps one block per column so numeric columns convert without
+    # being copied into a consolidated 2D block
+    return table.to_pandas(self_destruct=True, split_blocks=True)
+
+
+def _read_csv_polars(file_path: Path, dtype: str = 'float64',
+                     columns: Optional[Tuple[str, ...]] = None) -> pd.DataFrame:
+    """Read a CSV file with a Polars lazy scan, materializing only needed columns.
+    
+    Args:
+        file_path: Path to CSV file
+        dtype: Floating point dtype the 'pred' column is parsed into
+        columns: Columns to keep (missing ones are ignored); None keeps all
+        
+    Returns:
+        DataFrame with the file contents
+    """
+    import polars as pl
+    
+    pred_dtype = pl.Float32 if dtype == 'float32' else pl.Float64
+    lazy = pl.scan_csv(file_path, schema_overrides={'pred': pred_dtype})
+    
+    if columns is not None:
+        # Projection pushdown: unused columns are never parsed
+        lazy = lazy.select([col for col in lazy.collect_schema().names() if col in columns])
+    
+    return lazy.collect(engine='streaming').to_pandas()
+
+
+def resolve_io_engine(engine: str) -> str:
+    """Resolve the CSV parser to use, falling back to pandas if unavailable.
+    
+    Args:
+        engine: Requested engine name (one of IO_ENGINES)
+        
+    Returns:
+        Engine name that will actually be used
+        
+    Raises:
+        ValueError: If engine is not supported
+    """
+    if engine not in IO_ENGINES:
+        raise ValueError(f"Unsupported IO engine: {engine}. Supported: {list(IO_ENGINES)}")
+    
+    if engine == 'pyarrow':
+        try:
+            import pyarrow.csv  # noqa: F401
+        except ImportError:
+            warnings.warn("pyarrow is not installed, falling back to the pandas CSV parser")
+            return 'pandas'
+    
+    if engine == 'polars':
+        try:
+            import polars  # noqa: F401
+        except ImportError:
+            warnings.warn("polars is not installed, falling back to the pandas CSV parser")
+            return 'pandas'
+        try:
+            import pyarrow  # noqa: F401  (polars' to_pandas() converts via pyarrow)
+        except ImportError:
+            warnings.warn("pyarrow is not installed (required by the polars engine), "
+                          "falling back to the pandas CSV parser")
+            return 'pandas'
+    
+    return engine
+
+
+def read_csv_file(file_path: Path, engine: str = 'pandas', dtype: str = 'float64',
+                  columns: Optional[Tuple[str, ...]] = None) -> pd.DataFrame:
+    """Read a single CSV file with the requested parser.
+    
+    Args:
+        file_path: Path to CSV file
+        engine: Resolved engine name (see resolve_io_engine)
+        dtype: Floating point dtype for the 'pred' column, applied while
+            parsing where the engine supports it
+        columns: Columns to keep where the engine supports projection
+            (pyarrow, polars); None keeps all
+        
+    Returns:
+        DataFrame with the file contents
+    """
+    if engine == 'pyarrow':
+        return _read_csv_pyarrow(file_path, dtype, columns)
+    if engine == 'polars':
+        return _read_csv_polars(file_path, dtype, columns)
+    return pd.read_csv(file_path, memory_map=file_path.stat().st_size >= _MMAP_THRESHOLD)
+
+
+def resolve_cache_dir(cache_dir: Optional[str]) -> Optional[Path]:
+    """Resolve the Parquet cache directory.
+    
+    Args:
+        cache_dir: Cache directory, or None to disable caching
+        
+    Returns:
+        Existing cache directory, or None if caching is disabled or
+        unavailable (Parquet support requires pyarrow)
+    """
+    if cache_dir is None:
+        return None
+    
+    try:
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        return None
+    
+    cache_path = Path(cache_dir).expanduser()
+    try:
+        cache_path.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        warnings.warn(f"Could not create cache directory {cache_path}: {e}")
+        return None
+    
+    return cache_path
+
+
+def _cache_key(file_path: Path, engine: str, dtype: str,
+               columns: Optional[Tuple[str, ...]] = None) -> Tuple[str, str]:
+    """Build a cache key for a parsed CSV file.
+    
+    Returns:
+        Tuple of (prefix, key). The prefix identifies the file path and read
+        options; the key additionally covers mtime, size and header, so a new
+        version of the file gets a new key under the same prefix.
+    """
+    prefix = hashlib.sha1()
+    for part in (str(file_path.resolve()), engine, dtype,
+                 ','.join(columns) if columns is not None else '*'):
+        prefix.update(part.encode('utf-8'))
+        prefix.update(b'\0')
+    prefix = prefix.hexdigest()[:16]
+    
+    stat = file_path.stat()
+    with open(file_path, 'rb') as f:
+        header = f.readline()
+    
+    key = hashlib.sha1(prefix.encode('utf-8'))
+    for part in (str(stat.st_mtime_ns), str(stat.st_size)):
+        key.update(part.encode('utf-8'))
+        key.update(b'\0')
+    key.update(header)
+    
+    return prefix, f"{prefix}-{key.hexdigest()}"
+
+
+def read_csv_cached(file_path: Path, engine: str = 'pandas',
+                    cache_dir: Optional[Path] = None, dtype: str = 'float64',
+                    columns: Optional[Tuple[str, ...]] = None) -> pd.DataFrame:
+    """Read a CSV file through the Parquet cache.
+    
+    On a cache hit the parsed frame is loaded from Parquet instead of
+    re-parsing the CSV. On a miss the CSV is parsed and written to the cache,
+    replacing any entry for an earlier version of the same file.
+    
+    Args:
+        file_path: Path to CSV file
+        engine: Resolved engine name (see resolve_io_engine)
+        cache_dir: Resolved cache directory (see resolve_cache_dir), or None
+        dtype: Floating point dtype for the 'pred' column (see read_csv_file)
+        columns: Columns to keep (see read_csv_file)
+        
+    Returns:
+        DataFrame with the file contents
+    """
+    if cache_dir is None:
+        return read_csv_file(file_path, engine, dtype, columns)
+    
+    prefix, key = _cache_key(file_path, engine, dtype, columns)
+    cache_path = cache_dir / f"{key}.parquet"
+    
+    if cache_path.exists():
+        try:
+            return pd.read_parquet(cache_path, engine='pyarrow')
+        except Exception as e:
+            warnings.warn(f"Ignoring unreadable cache entry for {file_path.name}: {e}")
+    
+    df = read_csv_file(file_path, engine, dtype, columns)
+    
+    # Write to a temporary file first so concurrent runs never see a partial entry
+    tmp_path = cache_path.with_name(f"{cache_path.stem}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        df.to_parquet(tmp_path, engine='pyarrow', compression='zstd', index=False)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        warnings.warn(f"Could not cache {file_path.name}: {e}")
+        tmp_path.unlink(missing_ok=True)
+        return df
+    
+    # Drop entries for earlier versions of this file so edits don't pile up copies
+    for stale_path in cache_dir.glob(f"{prefix}-*.parquet"):
+        if stale_path != cache_path:
+            stale_path.unlink(missing_ok=True)
+    
+    return df
+
+
+def _read_oof_file(file_path: Path, engine: str, time_col: Optional[str],
+                   cache_dir: Optional[Path], dtype: str, target_col: str) -> pd.DataFrame:
+    """Read and validate a single OOF file."""
+    columns = ('id', 'pred', 'fold', target_col) + ((time_col,) if time_col else ())
+    df = read_csv_cached(file_path, engine, cache_dir, dtype, columns)
+    validate_oof_schema(df, file_path.name, time_col)
+    if 'fold' in df.columns:
+        # A handful of fold labels: store int8 codes, and per-fold filters
+        # compare codes instead of values
+        df['fold'] = df['fold'].astype('category')
+    return downcast_predictions(df, dtype, exclude=('id', target_col, 'fold'))
+
+
+def _read_sub_file(file_path: Path, engine: str, cache_dir: Optional[Path],
+                   dtype: str) -> pd.DataFrame:
+    """Read and validate a single submission file."""
+    df = read_csv_cached(file_path, engine, cache_dir, dtype, ('id', 'pred'))
+    validate_sub_schema(df, file_path.name)
+    return downcast_predictions(df, dtype, exclude=('id',))
+
+
+def _map_files(read_file: Callable[[Path], pd.DataFrame], file_paths: List[Path],
+               n_jobs: int = -1) -> List[pd.DataFrame]:
+    """Read files concurrently, preserving input order.
+    
+    Threads are enough here: both the pandas C parser and PyArrow release
+    the GIL while parsing, so disk reads and parsing overlap across files.
+    
+    Args:
+        read_file: Function reading a single file
+        file_paths: Files to read
+        n_jobs: Number of reader threads (-1 for all CPUs)
+        
+    Returns:
+        List of DataFrames in the same order as file_paths
+    """
+    max_workers = (os.cpu_count() or 1) if n_jobs < 1 else n_jobs
+    max_workers = min(max_workers, len(file_paths))
+    
+    if max_workers <= 1:
+        return [read_file(file_path) for file_path in file_paths]
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(read_file, file_paths))
+
+
+def read_oof_files(oof_dir: str, time_col: Optional[str] = None,
+                   engine: str = 'pandas', n_jobs: int = -1,
+                   cache_dir: Optional[str] = None, dtype: str = 'float64',
+                   target_col: str = 'target') -> Dict[str, pd.DataFrame]:
     """Read all OOF files from directory.
     
     Args:
         oof_dir: Directory containing OOF CSV files
         time_col: Optional time column name for validation
+        engine: CSV parser to use ('pandas', 'pyarrow' or 'polars')
+        n_jobs: Number of files read in parallel (-1 for all CPUs)
+        cache_dir: Directory of the Parquet cache of parsed files (None disables caching)
+        dtype: Floating point dtype for prediction columns ('float32' or 'float64')
+        target_col: Name of target column, kept at full precision
         
     Returns:
-        Dictionary mapping filename to DataFrame with columns [id, pred, fold?, target?, time_col?]
+        Dictionary mapping filename to DataFrame with columns [id, pred, fold?, target?, time_col?],
+        in sorted filename order
     """
     oof_files = {}
     oof_path = Path(oof_dir)
@@ -166,18 +512,24 @@ def read_oof_files(oof_dir: str, time_col: Optional[str] = None) -> Dict[str, pd
     if not oof_path.exists():
         raise FileNotFoundError(f"OOF directory not found: {oof_dir}")
     
-    for file_path in oof_path.glob("oof_*.csv"):
-        df = pd.read_csv(file_path)
-        
-        # Validate schema
-        validate_oof_schema(df, file_path.name, time_col)
-        
+    engine = resolve_io_engine(engine)
+    
+    file_paths = sorted(oof_path.glob("oof_*.csv"))
+    read_file = partial(_read_oof_file, engine=engine, time_col=time_col,
+                        cache_dir=resolve_cache_dir(cache_dir), dtype=dtype,
+                        target_col=target_col)
+    
+    loaded_msgs = []
+    for file_path, df in zip(file_paths, _map_files(read_file, file_paths, n_jobs)):
         # Check if fold column exists
         has_fold = 'fold' in df.columns
         
         oof_files[file_path.stem] = df
         
-        print(f"Loaded OOF file: {file_path.name} ({len(df)} rows, fold={'yes' if has_fold else 'no'})")
+        loaded_msgs.append(f"Loaded OOF file: {file_path.name} ({len(df)} rows, fold={'yes' if has_fold else 'no'})")
+    
+    if loaded_msgs:
+        print('\n'.join(loaded_msgs))
     
     if not oof_files:
         raise ValueError(f"No OOF files found in {oof_dir}")
@@ -185,14 +537,20 @@ def read_oof_files(oof_dir: str, time_col: Optional[str] = None) -> Dict[str, pd
     return oof_files
 
 
-def read_sub_files(sub_dir: str) -> Dict[str, pd.DataFrame]:
+def read_sub_files(sub_dir: str, engine: str = 'pandas', n_jobs: int = -1,
+                   cache_dir: Optional[str] = None, dtype: str = 'float64') -> Dict[str, pd.DataFrame]:
     """Read all submission files from directory.
     
     Args:
         sub_dir: Directory containing submission CSV files
+        engine: CSV parser to use ('pandas', 'pyarrow' or 'polars')
+        n_jobs: Number of files read in parallel (-1 for all CPUs)
+        cache_dir: Directory of the Parquet cache of parsed files (None disables caching)
+        dtype: Floating point dtype for prediction columns ('float32' or 'float64')
         
     Returns:
-        Dictionary mapping filename to DataFrame with columns [id, pred]
+        Dictionary mapping filename to DataFrame with columns [id, pred], in sorted
+        filename order
     """
     sub_files = {}
     sub_path = Path(sub_dir)
@@ -200,15 +558,20 @@ def read_sub_files(sub_dir: str) -> Dict[str, pd.DataFrame]:
     if not sub_path.exists():
         raise FileNotFoundError(f"Submission directory not found: {sub_dir}")
     
-    for file_path in sub_path.glob("sub_*.csv"):
-        df = pd.read_csv(file_path)
-        
-        # Validate schema
-        validate_sub_schema(df, file_path.name)
-        
+    engine = resolve_io_engine(engine)
+    
+    file_paths = sorted(sub_path.glob("sub_*.csv"))
+    read_file = partial(_read_sub_file, engine=engine, cache_dir=resolve_cache_dir(cache_dir),
+                        dtype=dtype)
+    
+    loaded_msgs = []
+    for file_path, df in zip(file_paths, _map_files(read_file, file_paths, n_jobs)):
         sub_files[file_path.stem] = df
         
-        print(f"Loaded submission file: {file_path.name} ({len(df)} rows)")
+        loaded_msgs.append(f"Loaded submission file: {file_path.name} ({len(df)} rows)")
+    
+    if loaded_msgs:
+        print('\n'.join(loaded_msgs))
     
     if not sub_files:
         raise ValueError(f"No submission files found in {sub_dir}")
@@ -216,6 +579,19 @@ def read_sub_files(sub_dir: str) -> Dict[str, pd.DataFrame]:
     return sub_files
 
 
+def _ids_already_aligned(sub_files: Dict[str, pd.DataFrame]) -> bool:
+    """Whether every file already has the aligned layout: the same strictly
+    increasing IDs under a default RangeIndex (e.g. all written by one pipeline).
+    """
+    first_ids = next(iter(sub_files.values()))['id'].to_numpy()
+    if len(first_ids) > 1 and not (first_ids[1:] > first_ids[:-1]).all():
+        return False
+    
+    return all(df.index.equals(pd.RangeIndex(len(df))) and
+               np.array_equal(df['id'].to_numpy(), first_ids)
+               for df in sub_files.values())
+
+
 def align_submission_ids(sub_files: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
     """Align submission files by ID using inner join.
     
@@ -228,51 +604,159 @@ def align_submission_ids(sub_files: Dict[str, pd.DataFrame]) -> Dict[str, pd.Dat
     if len(sub_files) <= 1:
         return sub_files
     
-    # Get all unique IDs
-    all_ids = set()
-    for df in sub_files.values():
-        all_ids.update(df['id'].unique())
+    if _ids_already_aligned(sub_files):
+        return dict(sub_files)
+    
+    # Hash each file's IDs exactly once; everything below reuses these uniques
+    unique_ids = {name: pd.Index(df['id']).unique() for name, df in sub_files.items()}
     
-    # Find common IDs
-    common_ids = set(sub_files[list(sub_files.keys())[0]]['id'].unique())
-    for df in sub_files.values():
-        common_ids = common_ids.intersection(set(df['id'].unique()))
+    # Find common IDs in one pass of hashed Index intersections
+    common_ids = reduce(lambda left, right: left.intersection(right), unique_ids.values())
+    common_ids = common_ids.sort_values().rename('id')
     
-    if len(common_ids) < len(all_ids):
+    # Every file holding exactly the common IDs means nothing was dropped
+    if any(len(ids) != len(common_ids) for ids in unique_ids.values()):
+        all_ids = reduce(lambda left, right: left.union(right), unique_ids.values())
         warnings.warn(f"ID mismatch detected: {len(all_ids)} total IDs, {len(common_ids)} common IDs")
     
     # Filter to common IDs
     aligned_files = {}
     for name, df in sub_files.items():
-        aligned_df = df[df['id'].isin(common_ids)].copy()
-        aligned_df = aligned_df.sort_values('id').reset_index(drop=True)
+        if len(unique_ids[name]) == len(df):
+            # Hash join on the sorted common IDs, keeping the original column order
+            aligned_df = df.set_index('id').reindex(common_ids).reset_index()[df.columns]
+        else:
+            # sort_values already returns a new frame, so no defensive copy is needed
+            aligned_df = df[df['id'].isin(common_ids)].sort_values('id', kind='stable',
+                                                                  ignore_index=True)
         aligned_files[name] = aligned_df
     
     return aligned_files
 
 
+def write_csv(df: pd.DataFrame, path: Path) -> None:
+    """Write a DataFrame as CSV without its index.
+    
+    All-numeric frames are formatted by the PyArrow CSV writer, which is several
+    times faster than pandas; anything else (or no pyarrow) goes through to_csv.
+    
+    Args:
+        df: DataFrame to write
+        path: Output CSV path
+    """
+    numeric = all(pd.api.types.is_numeric_dtype(dtype) for dtype in df.dtypes)
+    try:
+        import pyarrow as pa
+        from pyarrow import csv as pacsv
+    except ImportError:
+        numeric = False
+    
+    if not numeric:
+        df.to_csv(path, index=False)
+        return
+    
+    # PyArrow always quotes header names, so write the header line ourselves
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    with open(path, 'wb') as f:
+        f.write((','.join(map(str, df.columns)) + '\n').encode('utf-8'))
+        pacsv.write_csv(table, f, write_options=pacsv.WriteOptions(include_header=False))
+
+
 def save_outputs(output_dir: str, best_submission: pd.DataFrame, 
-                methods_df: pd.DataFrame, report_html: str) -> None:
+                methods_df: pd.DataFrame, report_html: Optional[str],
+                fmt: str = "csv") -> Path:
     """Save all outputs to directory.
     
     Args:
         output_dir: Directory to save outputs
         best_submission: Best submission DataFrame
         methods_df: Methods comparison DataFrame
-        report_html: HTML report content
+        report_html: HTML report content, or None to skip report.html
+        fmt: Submission file format, one of OUTPUT_FORMATS
+        
+    Returns:
+        Path of the saved submission file
     """
+    if fmt not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format: {fmt}. Supported: {OUTPUT_FORMATS}")
+    
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
     
+    if fmt == 'parquet':
+        try:
+            import pyarrow.parquet  # noqa: F401
+        except ImportError:
+            warnings.warn("pyarrow is not installed, saving submission as CSV")
+            fmt = 'csv'
+    
     # Save best submission
-    best_submission.to_csv(output_path / "best_submission.csv", index=False)
-    print(f"Saved best submission: {output_path / 'best_submission.csv'}")
+    submission_path = output_path / f"best_submission.{fmt}"
+    if fmt == 'parquet':
+        best_submission.to_parquet(submission_path, engine='pyarrow', compression='zstd',
+                                   row_group_size=_PARQUET_ROW_GROUP_SIZE, index=False)
+    else:
+        write_csv(best_submission, submission_path)
+    print(f"Saved best submission: {submission_path}")
     
     # Save methods comparison
     methods_df.to_csv(output_path / "methods.csv", index=False)
     print(f"Saved methods comparison: {output_path / 'methods.csv'}")
     
     # Save HTML report
-    with open(output_path / "report.html", "w") as f:
-        f.write(report_html)
-    print(f"Saved HTML report: {output_path / 'report.html'}")
+    if report_html is not None:
+        # Encode once and hand the whole report (inline base64 plots) to a single write
+        with open(output_path / "report.html", "wb", buffering=_REPORT_WRITE_BUFFER) as f:
+            f.write(report_html.encode('utf-8'))
+        print(f"Saved HTML report: {output_path / 'report.html'}")
+    
+    return submission_path
+
+
+def _to_jsonable(obj: Any) -> Any:
+    """Default JSON serializer for numpy and pandas objects."""
+    if isinstance(obj, pd.DataFrame):
+        return obj.to_dict('records')
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _finite_or_none(obj: Any, default: Callable) -> Any:
+    """Recursively map non-finite floats to None, as orjson writes them (null)."""
+    if isinstance(obj, float):
+        return obj if np.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite_or_none(value, default) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite_or_none(value, default) for value in obj]
+    if obj is None or isinstance(obj, (str, int, bool)):
+        return obj
+    return _finite_or_none(default(obj), default)
+
+
+def write_json(data: Any, path: Any, default: Optional[Callable] = None) -> None:
+    """Write data as indented JSON, using orjson when it is installed.
+    
+    Args:
+        data: Data to serialize; numpy arrays/scalars and DataFrames (as records)
+            are handled unless a custom default is given
+        path: Output file path
+        default: Fallback serializer for unsupported objects
+    """
+    if default is None:
+        default = _to_jsonable
+    
+    try:
+        import orjson
+    except ImportError:
+        # NaN/inf become null rather than the non-standard NaN/Infinity tokens
+        with open(path, 'w') as f:
+            json.dump(_finite_or_none(data, default), f, indent=2, allow_nan=False)
+        return
+    
+    option = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    with open(path, 'wb') as f:
+        f.write(orjson.dumps(data, default=default, option=option))
@@ -2,9 +2,149 @@
 
 import numpy as np
 import pandas as pd
-from sklearn.metrics import roc_auc_score, mean_squared_error, mean_absolute_error
+from sklearn.metrics import roc_auc_score
 from typing import Dict, List, Optional, Union
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def _auc_kernel(is_pos: np.ndarray, y_pred: np.ndarray) -> float:
+    """Rank-sum (Mann-Whitney U) AUC with average ranks for ties.
+    
+    Args:
+        is_pos: Boolean mask of positive samples
+        y_pred: Predicted scores
+        
+    Returns:
+        Area under the ROC curve
+    """
+    order = np.argsort(y_pred, kind='mergesort')
+    n = y_pred.shape[0]
+    n_pos = 0
+    rank_sum = 0.0
+    
+    i = 0
+    while i < n:
+        # Find the run of tied scores starting at position i
+        j = i
+        while j + 1 < n and y_pred[order[j + 1]] == y_pred[order[i]]:
+            j += 1
+        
+        avg_rank = 0.5 * (i + j) + 1.0
+        for k in range(i, j + 1):
+            if is_pos[order[k]]:
+                n_pos += 1
+                rank_sum += avg_rank
+        i = j + 1
+    
+    n_neg = n - n_pos
+    if n_pos == 0 or n_neg == 0:
+        return np.nan
+    return (rank_sum - 0.5 * n_pos * (n_pos + 1)) / (n_pos * n_neg)
+
+
+def _auc_numba(y_true: np.ndarray, y_pred: np.ndarray) -> float:
+    """AUC for binary labels using the jitted rank-sum kernel.
+    
+    Equivalent to sklearn's roc_auc_score; the larger label is positive.
+    """
+    if np.isnan(y_pred).any():
+        raise ValueError("Input contains NaN")
+    
+    return float(_auc_kernel(y_true == y_true.max(), y_pred))
+
+
+def _is_binary(y_true: np.ndarray) -> bool:
+    """Whether y_true holds exactly two distinct values (O(n), no sort)."""
+    if len(y_true) == 0:
+        return False
+    lo, hi = y_true.min(), y_true.max()
+    return lo != hi and bool(((y_true == lo) | (y_true == hi)).all())
+
+
+def auc_score(y_true: np.ndarray, y_pred: np.ndarray) -> float:
+    """ROC AUC for binary labels (jitted when numba is available)."""
+    y_true = np.asarray(y_true)
+    if not _is_binary(y_true):
+        raise ValueError("AUC requires binary classification labels")
+    if NUMBA_AVAILABLE:
+        return _auc_numba(y_true, np.asarray(y_pred))
+    return float(roc_auc_score(y_true, y_pred))
+
+
+def _residuals(y_true: np.ndarray, y_pred: np.ndarray) -> np.ndarray:
+    """y_true - y_pred as float64, with sklearn's length and NaN checks."""
+    y_true = np.asarray(y_true, dtype=np.float64)
+    y_pred = np.asarray(y_pred, dtype=np.float64)
+    if len(y_true) != len(y_pred):
+        raise ValueError(f"Found input variables with inconsistent numbers of samples: "
+                         f"[{len(y_true)}, {len(y_pred)}]")
+    if np.isnan(y_true).any() or np.isnan(y_pred).any():
+        raise ValueError("Input contains NaN")
+    
+    return y_true - y_pred
+
+
+def neg_mse_score(y_true: np.ndarray, y_pred: np.ndarray) -> float:
+    """Negative mean squared error (negative for maximization)."""
+    diff = _residuals(y_true, y_pred)
+    return -float(np.mean(diff * diff))
+
+
+def neg_mae_score(y_true: np.ndarray, y_pred: np.ndarray) -> float:
+    """Negative mean absolute error (negative for maximization)."""
+    diff = _residuals(y_true, y_pred)
+    return -float(np.mean(np.abs(diff)))
+
+
+# Score function per metric, bound once by Scorer instead of dispatched per call
+_METRIC_TABLE = {
+    "auc": auc_score,
+    "mse": neg_mse_score,
+    "mae": neg_mae_score,
+}
+
+
+@njit(parallel=True, cache=True)
+def _windowed_auc_kernel(is_pos: np.ndarray, y_pred: np.ndarray,
+                         starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """AUC of each [start, end) slice, with slices scored in parallel."""
+    out = np.empty(starts.shape[0])
+    for w in prange(starts.shape[0]):
+        out[w] = _auc_kernel(is_pos[starts[w]:ends[w]], y_pred[starts[w]:ends[w]])
+    return out
+
+
+def windowed_auc(y_true: np.ndarray, y_pred: np.ndarray,
+                 starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """AUC over contiguous row ranges of binary labels and predictions.
+    
+    Args:
+        y_true: Binary labels, sorted so each window is contiguous
+        y_pred: Predicted scores in the same order
+        starts: Start row of each window
+        ends: End row (exclusive) of each window
+        
+    Returns:
+        AUC per window, NaN where a window holds a single class
+    """
+    y_true = np.asarray(y_true)
+    return _windowed_auc_kernel(y_true == y_true.max(), np.asarray(y_pred),
+                                np.asarray(starts, dtype=np.int64),
+                                np.asarray(ends, dtype=np.int64))
+
 
 class Scorer:
     """Simple scorer for different metrics."""
@@ -17,33 +157,15 @@ class Scorer:
         """
         self.metric = metric.lower()
         self._validate_metric()
+        
+        # Bind the score function once; score(y_true, y_pred) -> float
+        self.score = _METRIC_TABLE[self.metric]
     
     def _validate_metric(self):
         """Validate that metric is supported."""
-        supported_metrics = ["auc", "mse", "mae"]
+        supported_metrics = list(_METRIC_TABLE)
         if self.metric not in supported_metrics:
             raise ValueError(f"Unsupported metric: {self.metric}. Supported: {supported_metrics}")
-    
-    def score(self, y_true: np.ndarray, y_pred: np.ndarray) -> float:
-        """Compute metric score.
-        
-        Args:
-            y_true: True labels
-            y_pred: Predicted values
-            
-        Returns:
-            Metric score
-        """
-        if self.metric == "auc":
-            if len(np.unique(y_true)) != 2:
-                raise ValueError("AUC requires binary classification labels")
-            return roc_auc_score(y_true, y_pred)
-        elif self.metric == "mse":
-            return -mean_squared_error(y_true, y_pred)  # Negative for maximization
-        elif self.metric == "mae":
-            return -mean_absolute_error(y_true, y_pred)  # Negative for maximization
-        else:
-            raise ValueError(f"Unknown metric: {self.metric}")
 
 
 def compute_oof_metrics(oof_data: Dict[str, pd.DataFrame], 
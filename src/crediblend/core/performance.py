@@ -24,22 +24,29 @@ def check_memory_cap(memory_cap_mb: float) -> bool:
 
 
 def optimize_dtypes(df: pd.DataFrame) -> pd.DataFrame:
-    """Optimize DataFrame dtypes to reduce memory usage."""
-    df_optimized = df.copy()
+    """Optimize DataFrame dtypes to reduce memory usage.
+    
+    Frames whose columns are already compact (e.g. float32 predictions cast
+    at read time) are returned as is, without a copy.
+    """
+    conversions = {}
     
     # Convert float64 to float32 where possible
-    for col in df_optimized.select_dtypes(include=[np.float64]).columns:
-        if df_optimized[col].min() >= np.finfo(np.float32).min and \
-           df_optimized[col].max() <= np.finfo(np.float32).max:
-            df_optimized[col] = df_optimized[col].astype(np.float32)
+    for col in df.select_dtypes(include=[np.float64]).columns:
+        if df[col].min() >= np.finfo(np.float32).min and \
+           df[col].max() <= np.finfo(np.float32).max:
+            conversions[col] = np.float32
     
     # Convert int64 to int32 where possible
-    for col in df_optimized.select_dtypes(include=[np.int64]).columns:
-        if df_optimized[col].min() >= np.iinfo(np.int32).min and \
-           df_optimized[col].max() <= np.iinfo(np.int32).max:
-            df_optimized[col] = df_optimized[col].astype(np.int32)
+    for col in df.select_dtypes(include=[np.int64]).columns:
+        if df[col].min() >= np.iinfo(np.int32).min and \
+           df[col].max() <= np.iinfo(np.int32).max:
+            conversions[col] = np.int32
+    
+    if not conversions:
+        return df
     
-    return df_optimized
+    return df.astype(conversions)
 
 
 def chunked_read_csv(file_path: Path, chunk_size: int = 10000, 
@@ -107,16 +114,18 @@ def parallel_weight_optimization(oof_data: Dict[str, pd.DataFrame],
                                 sub_data: Dict[str, pd.DataFrame],
                                 scorer, target_col: str,
                                 n_restarts: int = 16,
-                                n_jobs: int = -1) -> Tuple[Dict[str, float], float, Dict[str, Any]]:
-    """Optimize weights in parallel."""
+                                n_jobs: int = -1,
+                                random_state: Optional[int] = None,
+                                backend: str = "random",
+                                n_iters: int = 200) -> Tuple[Dict[str, float], float, Dict[str, Any]]:
+    """Optimize weights in parallel, one restart per worker process."""
     from .weights import optimize_weights
     
-    if n_jobs == 1:
-        return optimize_weights(oof_data, sub_data, scorer, target_col, n_restarts, 4)
+    _, weight_info = optimize_weights(oof_data, sub_data, scorer, target_col,
+                                      n_restarts, n_jobs, random_state,
+                                      backend=backend, n_iters=n_iters)
     
-    # For now, use single-threaded optimization
-    # TODO: Implement proper parallel optimization
-    return optimize_weights(oof_data, sub_data, scorer, target_col, n_restarts, 4)
+    return weight_info['weights'], weight_info['best_score'], weight_info
 
 
 def parallel_stacking(oof_data: Dict[str, pd.DataFrame],
@@ -215,8 +224,12 @@ def auto_strategy_selection(oof_data: Dict[str, pd.DataFrame],
 
 def performance_guardrails(data_dict: Dict[str, pd.DataFrame],
                           memory_cap_mb: float = 4096,
-                          max_models: int = 20) -> Dict[str, pd.DataFrame]:
-    """Apply performance guardrails to data."""
+                          max_models: int = 20,
+                          optimize: bool = True) -> Dict[str, pd.DataFrame]:
+    """Apply performance guardrails to data.
+    
+    Set optimize=False to keep the input dtypes (e.g. float64 predictions).
+    """
     print("🛡️  Applying performance guardrails...")
     
     # Check memory usage
@@ -232,6 +245,9 @@ def performance_guardrails(data_dict: Dict[str, pd.DataFrame],
         print(f"  Limited to {max_models} models")
         return limited_data
     
+    if not optimize:
+        return data_dict
+    
     # Optimize data types
     optimized_data = {}
     for name, df in data_dict.items():
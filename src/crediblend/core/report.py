@@ -3,10 +3,33 @@
 import os
 from pathlib import Path
 from typing import Dict, Any, Optional
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+import numpy as np
 import pandas as pd
 
 
+_TEMPLATE_DIR = Path(__file__).parent.parent / "templates"
+
+
+def _bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+    """On-disk cache of compiled templates, reused across processes.
+    
+    Uses Jinja's per-user directory in the system temp dir; entries are keyed
+    by the template source checksum. Returns None if that directory is unusable.
+    """
+    try:
+        return FileSystemBytecodeCache()
+    except (OSError, RuntimeError):
+        return None
+
+
+# Shared environment: templates are parsed and compiled once per process, and
+# loaded from the bytecode cache in later processes. Packaged templates don't
+# change at runtime, so skip the mtime check on lookup.
+_ENV = Environment(loader=FileSystemLoader(str(_TEMPLATE_DIR)), auto_reload=False,
+                   bytecode_cache=_bytecode_cache())
+
+
 def load_template(template_name: str = "report.html.j2"):
     """Load Jinja2 template.
     
@@ -16,18 +39,12 @@ def load_template(template_name: str = "report.html.j2"):
     Returns:
         Template content
     """
-    # Get template directory
-    template_dir = Path(__file__).parent.parent / "templates"
-    template_path = template_dir / template_name
+    template_path = _TEMPLATE_DIR / template_name
     
     if not template_path.exists():
         raise FileNotFoundError(f"Template not found: {template_path}")
     
-    # Load template
-    env = Environment(loader=FileSystemLoader(str(template_dir)))
-    template = env.get_template(template_name)
-    
-    return template
+    return _ENV.get_template(template_name)
 
 
 def generate_report(oof_metrics: Dict[str, Dict[str, float]],
@@ -71,18 +88,15 @@ def generate_report(oof_metrics: Dict[str, Dict[str, float]],
         'window_metrics': window_metrics if window_metrics is not None and not window_metrics.empty else None,
     }
     
-    # Add summary statistics
-    if not methods_df.empty and 'overall_oof' in methods_df.columns:
-        valid_oof = methods_df[methods_df['overall_oof'].notna()]
-        if not valid_oof.empty:
-            context['best_model'] = valid_oof.loc[valid_oof['overall_oof'].idxmax(), 'model']
-            context['best_oof_score'] = valid_oof['overall_oof'].max()
-        else:
-            context['best_model'] = None
-            context['best_oof_score'] = None
-    else:
-        context['best_model'] = None
-        context['best_oof_score'] = None
+    # Add summary statistics (best model by OOF score, found on the raw array)
+    context['best_model'] = None
+    context['best_oof_score'] = None
+    if 'overall_oof' in methods_df.columns:
+        scores = methods_df['overall_oof'].to_numpy(dtype=np.float64)
+        if len(scores) and not np.isnan(scores).all():
+            best_i = int(np.nanargmax(scores))
+            context['best_model'] = methods_df['model'].iat[best_i]
+            context['best_oof_score'] = scores[best_i]
     
     # Generate HTML
     html_content = template.render(**context)
@@ -6,6 +6,7 @@ from typing import Dict, List, Tuple, Optional, Any
 import warnings
 from datetime import datetime, timedelta
 from sklearn.metrics import roc_auc_score
+from .metrics import auc_score, windowed_auc, _is_binary, NUMBA_AVAILABLE
 import matplotlib.pyplot as plt
 import seaborn as sns
 
@@ -76,7 +77,8 @@ def compute_windowed_metrics(oof_data: Dict[str, pd.DataFrame],
     Returns:
         DataFrame with windowed metrics
     """
-    window_metrics = []
+    models, windows, values, n_samples = [], [], [], []
+    use_auc_kernel = _is_auc_metric(metric_func)
     
     for model_name, df in oof_data.items():
         if target_col not in df.columns:
@@ -90,29 +92,89 @@ def compute_windowed_metrics(oof_data: Dict[str, pd.DataFrame],
             warnings.warn(f"Failed to create time windows for {model_name}: {e}")
             continue
         
-        # Compute metrics for each window
-        for window in df_windowed['window'].unique():
-            window_df = df_windowed[df_windowed['window'] == window]
-            
-            if len(window_df) < 2:  # Need at least 2 samples for AUC
-                continue
-            
-            y_true = window_df[target_col].values
-            y_pred = window_df['pred'].values
-            
-            try:
-                metric_value = metric_func(y_true, y_pred)
-                window_metrics.append({
-                    'model': model_name,
-                    'window': str(window),
-                    'auc': metric_value,
-                    'n_samples': len(window_df)
-                })
-            except Exception as e:
-                warnings.warn(f"Failed to compute metric for {model_name} window {window}: {e}")
-                continue
+        # Sort rows by window once so each window is a contiguous slice
+        order, starts, ends, window_labels = _window_bounds(df_windowed['window'])
+        y_true = df_windowed[target_col].to_numpy()[order]
+        y_pred = df_windowed['pred'].to_numpy()[order]
+        
+        # Need at least 2 samples for AUC
+        keep = (ends - starts) >= 2
+        starts, ends, window_labels = starts[keep], ends[keep], window_labels[keep]
+        
+        if use_auc_kernel and _is_binary(y_true) and not np.isnan(y_pred).any():
+            window_values = windowed_auc(y_true, y_pred, starts, ends)
+            failed = np.isnan(window_values)
+            if metric_func is roc_auc_score:
+                # sklearn returns NaN for single-class windows, so those rows are kept
+                for window in window_labels[failed]:
+                    warnings.warn(f"Only one class is present in {model_name} window {window}, "
+                                  f"ROC AUC score is not defined")
+                failed = np.zeros(len(starts), dtype=bool)
+            else:
+                for window in window_labels[failed]:
+                    warnings.warn(f"Failed to compute metric for {model_name} window {window}: "
+                                  f"AUC requires binary classification labels")
+        else:
+            window_values = np.full(len(starts), np.nan)
+            # Only windows that raise are dropped; a NaN metric value is kept
+            failed = np.zeros(len(starts), dtype=bool)
+            for i, (start, end) in enumerate(zip(starts, ends)):
+                try:
+                    window_values[i] = metric_func(y_true[start:end], y_pred[start:end])
+                except Exception as e:
+                    failed[i] = True
+                    warnings.warn(f"Failed to compute metric for {model_name} "
+                                  f"window {window_labels[i]}: {e}")
+        
+        ok = ~failed
+        models.extend([model_name] * int(ok.sum()))
+        windows.extend(str(window) for window in window_labels[ok])
+        values.extend(window_values[ok].tolist())
+        n_samples.extend((ends - starts)[ok].tolist())
+    
+    if not models:
+        return pd.DataFrame()
+    
+    return pd.DataFrame({
+        'model': models,
+        'window': windows,
+        'auc': values,
+        'n_samples': n_samples
+    })
+
+
+def _is_auc_metric(metric_func: callable) -> bool:
+    """Whether metric_func is an AUC that the jitted windowed kernel can replace.
+    
+    Without numba the kernel is a plain Python loop, slower than sklearn.
+    """
+    return NUMBA_AVAILABLE and (metric_func is roc_auc_score or metric_func is auc_score)
+
+
+def _window_bounds(window: pd.Series) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Group rows by window in order of first appearance.
+    
+    Args:
+        window: Window label per row (rows with a missing label are dropped)
+        
+    Returns:
+        Tuple of (row order, window starts, window ends, window labels)
+    """
+    codes, uniques = pd.factorize(window)
+    order = np.argsort(codes, kind='stable')
+    sorted_codes = codes[order]
+    
+    # Missing windows are coded -1 and sort first
+    first_valid = np.searchsorted(sorted_codes, 0)
+    order = order[first_valid:]
+    sorted_codes = sorted_codes[first_valid:]
+    
+    bounds = np.flatnonzero(np.diff(sorted_codes)) + 1
+    starts = np.concatenate(([0], bounds)) if len(order) else np.empty(0, dtype=np.int64)
+    ends = np.concatenate((bounds, [len(order)])) if len(order) else np.empty(0, dtype=np.int64)
+    window_labels = np.asarray(uniques.astype(object))[sorted_codes[starts]]
     
-    return pd.DataFrame(window_metrics)
+    return order, starts, ends, window_labels
 
 
 def compute_stability_scores(window_metrics: pd.DataFrame) -> Dict[str, Dict[str, float]]:
@@ -328,13 +390,15 @@ def create_stability_heatmap(stability_scores: Dict[str, Dict[str, float]]) -> s
 
 def generate_stability_report(window_metrics: pd.DataFrame,
                             stability_scores: Dict[str, Dict[str, float]],
-                            dominance_analysis: Dict[str, Any]) -> Dict[str, Any]:
+                            dominance_analysis: Dict[str, Any],
+                            include_plots: bool = True) -> Dict[str, Any]:
     """Generate comprehensive stability report.
     
     Args:
         window_metrics: DataFrame with windowed metrics
         stability_scores: Dictionary with stability scores
         dominance_analysis: Dictionary with dominance analysis
+        include_plots: Whether to render the windowed AUC and stability plots
         
     Returns:
         Dictionary with stability report
@@ -351,8 +415,9 @@ def generate_stability_report(window_metrics: pd.DataFrame,
     }
     
     # Generate plots
-    report['plots']['windowed_auc'] = create_windowed_auc_plot(window_metrics)
-    report['plots']['stability_heatmap'] = create_stability_heatmap(stability_scores)
+    if include_plots:
+        report['plots']['windowed_auc'] = create_windowed_auc_plot(window_metrics)
+        report['plots']['stability_heatmap'] = create_stability_heatmap(stability_scores)
     
     # Add warnings
     warnings = []
@@ -3,13 +3,19 @@
 import numpy as np
 import pandas as pd
 from scipy.optimize import minimize
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from joblib import Parallel, delayed
 from typing import Dict, List, Tuple, Optional, Callable, Any
 import warnings
 from itertools import product
 import random
 
 
+SEARCH_BACKENDS = ('random', 'optuna')
+
+# Minimum OOF rows before Optuna trials are pre-scored on a subsample
+_OPTUNA_RUNG_MIN_SAMPLES = 1000
+
+
 class WeightOptimizer:
     """Weight optimizer for ensemble blending."""
     
@@ -52,19 +58,24 @@ class WeightOptimizer:
             return 1e6  # Large penalty for invalid predictions
     
     def optimize_single_restart(self, X: np.ndarray, y: np.ndarray, 
-                              n_models: int) -> Tuple[np.ndarray, float]:
+                              n_models: int, seed: Optional[Any] = None) -> Tuple[np.ndarray, float]:
         """Single optimization restart.
         
         Args:
             X: Prediction matrix (n_samples, n_models)
             y: True labels (n_samples,)
             n_models: Number of models
+            seed: Seed for this restart's initialization (int or SeedSequence);
+                uses the global NumPy RNG when None
             
         Returns:
             Tuple of (best_weights, best_score)
         """
         # Random initialization
-        weights_init = np.random.dirichlet(np.ones(n_models))
+        if seed is None:
+            weights_init = np.random.dirichlet(np.ones(n_models))
+        else:
+            weights_init = np.random.default_rng(seed).dirichlet(np.ones(n_models))
         
         # Constraints: sum(weights) = 1, weights >= 0
         constraints = {'type': 'eq', 'fun': lambda w: np.sum(w) - 1}
@@ -107,7 +118,7 @@ class WeightOptimizer:
             X: Prediction matrix (n_samples, n_models)
             y: True labels (n_samples,)
             n_restarts: Number of random restarts
-            max_workers: Maximum number of workers
+            max_workers: Maximum number of worker processes (values below 1 use all cores)
             
         Returns:
             Tuple of (best_weights, best_score, optimization_info)
@@ -116,23 +127,23 @@ class WeightOptimizer:
         
         print(f"🔍 Optimizing weights with {n_restarts} restarts...")
         
-        # Parallel optimization
+        # Independent seed per restart so results don't depend on worker count
+        seeds = np.random.SeedSequence(self.random_state).spawn(n_restarts)
+        
+        # Restarts are independent and CPU-bound, so run them in separate processes
+        # Values below 1 mean all cores, as for the file readers (joblib rejects 0)
+        n_jobs = min(max_workers, n_restarts) if max_workers > 0 else -1
+        if n_jobs == 1:
+            restart_results = [self.optimize_single_restart(X, y, n_models, seed) for seed in seeds]
+        else:
+            restart_results = Parallel(n_jobs=n_jobs, backend='loky')(
+                delayed(self.optimize_single_restart)(X, y, n_models, seed) for seed in seeds
+            )
+        
         results = []
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all restarts
-            futures = []
-            for _ in range(n_restarts):
-                future = executor.submit(self.optimize_single_restart, X, y, n_models)
-                futures.append(future)
-            
-            # Collect results
-            for i, future in enumerate(as_completed(futures)):
-                try:
-                    weights, score = future.result()
-                    results.append((weights, score))
-                    print(f"  Restart {i+1}/{n_restarts}: score = {score:.6f}")
-                except Exception as e:
-                    warnings.warn(f"Restart {i+1} failed: {e}")
+        for i, (weights, score) in enumerate(restart_results):
+            results.append((weights, score))
+            print(f"  Restart {i+1}/{n_restarts}: score = {score:.6f}")
         
         if not results:
             raise RuntimeError("All optimization restarts failed")
@@ -156,6 +167,80 @@ class WeightOptimizer:
         print(f"✅ Best score: {best_score:.6f} (mean: {np.mean(all_scores):.6f})")
         
         return best_weights, best_score, optimization_info
+    
+    def optimize_optuna(self, X: np.ndarray, y: np.ndarray,
+                        n_trials: int = 200) -> Tuple[np.ndarray, float, Dict]:
+        """Bayesian weight search with Optuna's TPE sampler.
+        
+        Each model weight is sampled in [0, 1] and normalized to sum to 1. On
+        larger data every trial is first scored on a quarter of the rows so the
+        successive-halving pruner can stop poor candidates before the full score.
+        
+        Args:
+            X: Prediction matrix (n_samples, n_models)
+            y: True labels (n_samples,)
+            n_trials: Number of Optuna trials
+            
+        Returns:
+            Tuple of (best_weights, best_score, optimization_info)
+        """
+        import optuna
+        from optuna.pruners import SuccessiveHalvingPruner
+        from optuna.samplers import TPESampler
+        
+        optuna.logging.set_verbosity(optuna.logging.WARNING)
+        
+        n_samples, n_models = X.shape
+        
+        print(f"🔍 Optimizing weights with {n_trials} Optuna trials...")
+        
+        # Subsample rung for early pruning, only when it is large enough to score
+        rung_idx = None
+        if n_samples >= _OPTUNA_RUNG_MIN_SAMPLES:
+            rng = np.random.default_rng(self.random_state)
+            rung_idx = rng.permutation(n_samples)[:n_samples // 4]
+        
+        def trial_objective(trial) -> float:
+            weights = np.array([trial.suggest_float(f"w{i}", 0.0, 1.0) for i in range(n_models)])
+            
+            if rung_idx is not None:
+                trial.report(-self.objective(weights, X[rung_idx], y[rung_idx]), step=1)
+                if trial.should_prune():
+                    raise optuna.TrialPruned()
+            
+            return -self.objective(weights, X, y)
+        
+        study = optuna.create_study(
+            direction="maximize",
+            sampler=TPESampler(seed=self.random_state),
+            pruner=SuccessiveHalvingPruner(min_resource=1)
+        )
+        # Start from the uniform blend so the search never does worse than mean
+        study.enqueue_trial({f"w{i}": 1.0 for i in range(n_models)})
+        study.optimize(trial_objective, n_trials=n_trials)
+        
+        complete = [t for t in study.trials if t.state == optuna.trial.TrialState.COMPLETE]
+        all_scores = [t.value for t in complete]
+        
+        best_weights = np.array([study.best_params[f"w{i}"] for i in range(n_models)])
+        best_weights = best_weights / np.sum(best_weights)
+        best_score = study.best_value
+        
+        optimization_info = {
+            'backend': 'optuna',
+            'n_restarts': n_trials,
+            'n_pruned': n_trials - len(complete),
+            'best_score': best_score,
+            'mean_score': np.mean(all_scores),
+            'std_score': np.std(all_scores),
+            'min_score': np.min(all_scores),
+            'max_score': np.max(all_scores),
+            'convergence_rate': len([s for s in all_scores if s > best_score * 0.99]) / len(all_scores)
+        }
+        
+        print(f"✅ Best score: {best_score:.6f} ({len(complete)}/{n_trials} trials completed)")
+        
+        return best_weights, best_score, optimization_info
 
 
 def prepare_weight_data(oof_data: Dict[str, pd.DataFrame],
@@ -218,7 +303,9 @@ def optimize_weights(oof_data: Dict[str, pd.DataFrame],
                     target_col: str = "target",
                     n_restarts: int = 16,
                     max_workers: int = 4,
-                    random_state: Optional[int] = None) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+                    random_state: Optional[int] = None,
+                    backend: str = "random",
+                    n_iters: int = 200) -> Tuple[pd.DataFrame, Dict[str, Any]]:
     """Optimize ensemble weights.
     
     Args:
@@ -227,12 +314,24 @@ def optimize_weights(oof_data: Dict[str, pd.DataFrame],
         scorer: Scorer function
         target_col: Name of target column
         n_restarts: Number of random restarts
-        max_workers: Maximum number of workers
+        max_workers: Maximum number of worker processes (values below 1 use all cores)
         random_state: Random state
+        backend: Search backend ('random' restarts or 'optuna' TPE)
+        n_iters: Number of trials for the optuna backend
         
     Returns:
         Tuple of (weighted_predictions, weight_info)
     """
+    if backend not in SEARCH_BACKENDS:
+        raise ValueError(f"Unknown search backend: {backend}. Supported: {SEARCH_BACKENDS}")
+    
+    if backend == 'optuna':
+        try:
+            import optuna  # noqa: F401
+        except ImportError:
+            warnings.warn("optuna is not installed, falling back to random-restart search")
+            backend = 'random'
+    
     print(f"⚖️  Optimizing ensemble weights...")
     
     # Prepare data
@@ -242,9 +341,14 @@ def optimize_weights(oof_data: Dict[str, pd.DataFrame],
     optimizer = WeightOptimizer(scorer, random_state=random_state)
     
     # Optimize weights
-    best_weights, best_score, opt_info = optimizer.optimize_parallel(
-        X_oof, y_oof, n_restarts=n_restarts, max_workers=max_workers
-    )
+    if backend == 'optuna':
+        best_weights, best_score, opt_info = optimizer.optimize_optuna(
+            X_oof, y_oof, n_trials=n_iters
+        )
+    else:
+        best_weights, best_score, opt_info = optimizer.optimize_parallel(
+            X_oof, y_oof, n_restarts=n_restarts, max_workers=max_workers
+        )
     
     # Apply weights to submission data
     weighted_preds = np.dot(X_sub, best_weights)
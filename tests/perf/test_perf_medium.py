@@ -13,62 +13,67 @@ from crediblend.core.performance import (get_memory_usage, optimize_dtypes,
                                        memory_efficient_blend, estimate_memory_usage)
 
 
+@pytest.fixture(scope='module')
+def medium_oof_data():
+    """Create medium-scale OOF data (200k rows x 8 models)."""
+    rng = np.random.default_rng(42)
+    n_samples = 200000
+    n_models = 8
+    shape = (n_models, n_samples)
+    
+    # Create realistic predictions with some correlation, all models at once
+    base_pred = rng.beta(2, 5, shape)  # Skewed towards lower values
+    preds = np.clip(base_pred + rng.normal(0, 0.1, shape), 0, 1)
+    
+    # Create targets with some signal
+    targets = (base_pred + rng.normal(0, 0.2, shape) > 0.3).astype(np.int8)
+    
+    # Create folds
+    folds = rng.integers(0, 5, shape, dtype=np.int8)
+    
+    # One id array shared by every model's frame (copy=False keeps the reference)
+    ids = np.arange(n_samples, dtype=np.int32)
+    
+    oof_data = []
+    for i in range(n_models):
+        df = pd.DataFrame({
+            'id': ids,
+            'pred': preds[i],
+            'target': targets[i],
+            'fold': folds[i]
+        }, copy=False)
+        
+        oof_data.append(df)
+    
+    return oof_data
+
+
+@pytest.fixture(scope='module')
+def medium_sub_data():
+    """Create medium-scale submission data."""
+    rng = np.random.default_rng(42)
+    n_samples = 200000
+    n_models = 8
+    
+    preds = np.clip(rng.beta(2, 5, (n_models, n_samples)), 0, 1)
+    ids = np.arange(n_samples, dtype=np.int32)
+    
+    sub_data = []
+    for i in range(n_models):
+        df = pd.DataFrame({
+            'id': ids,
+            'pred': preds[i]
+        }, copy=False)
+        
+        sub_data.append(df)
+    
+    return sub_data
+
+
 @pytest.mark.slow
 class TestPerformanceMedium:
     """Performance tests for medium-scale data (200k rows x 8 models)."""
     
-    @pytest.fixture
-    def medium_oof_data(self):
-        """Create medium-scale OOF data (200k rows x 8 models)."""
-        np.random.seed(42)
-        n_samples = 200000
-        n_models = 8
-        
-        oof_data = []
-        for i in range(n_models):
-            # Create realistic predictions with some correlation
-            base_pred = np.random.beta(2, 5, n_samples)  # Skewed towards lower values
-            noise = np.random.normal(0, 0.1, n_samples)
-            pred = np.clip(base_pred + noise, 0, 1)
-            
-            # Create target with some signal
-            target = (base_pred + np.random.normal(0, 0.2, n_samples) > 0.3).astype(int)
-            
-            # Create folds
-            fold = np.random.randint(0, 5, n_samples)
-            
-            df = pd.DataFrame({
-                'id': range(n_samples),
-                'pred': pred,
-                'target': target,
-                'fold': fold
-            })
-            
-            oof_data.append(df)
-        
-        return oof_data
-    
-    @pytest.fixture
-    def medium_sub_data(self):
-        """Create medium-scale submission data."""
-        np.random.seed(42)
-        n_samples = 200000
-        n_models = 8
-        
-        sub_data = []
-        for i in range(n_models):
-            pred = np.random.beta(2, 5, n_samples)
-            pred = np.clip(pred, 0, 1)
-            
-            df = pd.DataFrame({
-                'id': range(n_samples),
-                'pred': pred
-            })
-            
-            sub_data.append(df)
-        
-        return sub_data
-    
     def test_memory_usage_tracking(self, medium_oof_data):
         """Test memory usage tracking."""
         initial_memory = get_memory_usage()
@@ -86,11 +91,11 @@ class TestPerformanceMedium:
     
     def test_dtype_optimization(self, medium_oof_data):
         """Test dtype optimization reduces memory usage."""
-        original_memory = sum(df.memory_usage(deep=True).sum() for df in medium_oof_data) / 1024 / 1024
+        original_memory = sum(df.memory_usage(deep=False).sum() for df in medium_oof_data) / 1024 / 1024
         print(f"Original memory: {original_memory:.1f}MB")
         
         optimized_data = [optimize_dtypes(df) for df in medium_oof_data]
-        optimized_memory = sum(df.memory_usage(deep=True).sum() for df in optimized_data) / 1024 / 1024
+        optimized_memory = sum(df.memory_usage(deep=False).sum() for df in optimized_data) / 1024 / 1024
         print(f"Optimized memory: {optimized_memory:.1f}MB")
         
         # Should reduce memory usage by at least 20%
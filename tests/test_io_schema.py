@@ -7,7 +7,8 @@ from pathlib import Path
 import tempfile
 import os
 
-from crediblend.core.io import validate_oof_schema, validate_sub_schema, create_meta_json
+from crediblend.core.io import (validate_oof_schema, validate_sub_schema, create_meta_json,
+                               save_outputs, write_json)
 
 
 class TestOOFSchemaValidation:
@@ -183,5 +184,89 @@ class TestMetaJSONCreation:
                 assert 'input_files' in meta
 
 
+class TestSaveOutputs:
+    """Test output file writing."""
+    
+    def test_save_outputs_parquet(self):
+        """Test best submission is written as Parquet when requested."""
+        pytest.importorskip("pyarrow")
+        best_submission = pd.DataFrame({'id': [1, 2, 3], 'pred': [0.1, 0.5, 0.9]})
+        methods_df = pd.DataFrame({'model': ['a'], 'overall_oof': [0.7]})
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            submission_path = save_outputs(temp_dir, best_submission, methods_df, "<html></html>",
+                                           fmt='parquet')
+            
+            assert submission_path == Path(temp_dir) / 'best_submission.parquet'
+            pd.testing.assert_frame_equal(pd.read_parquet(submission_path), best_submission)
+            assert (Path(temp_dir) / 'methods.csv').exists()
+    
+    def test_save_outputs_csv_roundtrip(self):
+        """Test the CSV submission reads back with the same header and values."""
+        best_submission = pd.DataFrame({'id': [1, 2, 3],
+                                        'pred': np.array([0.1, 2.5e-05, 0.9], dtype=np.float32)})
+        methods_df = pd.DataFrame({'model': ['a'], 'overall_oof': [0.7]})
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            submission_path = save_outputs(temp_dir, best_submission, methods_df, None)
+            
+            assert submission_path.read_text().splitlines()[0] == 'id,pred'
+            loaded = pd.read_csv(submission_path, dtype={'pred': np.float32})
+            pd.testing.assert_frame_equal(loaded, best_submission)
+    
+    def test_save_outputs_without_report(self):
+        """Test report.html is not written when no report is given."""
+        best_submission = pd.DataFrame({'id': [1, 2], 'pred': [0.2, 0.8]})
+        methods_df = pd.DataFrame({'model': ['a'], 'overall_oof': [0.7]})
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            submission_path = save_outputs(temp_dir, best_submission, methods_df, None)
+            
+            assert submission_path.exists()
+            assert not (Path(temp_dir) / 'report.html').exists()
+    
+    def test_save_outputs_invalid_format(self):
+        """Test unknown output formats are rejected."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with pytest.raises(ValueError, match="Unknown output format"):
+                save_outputs(temp_dir, pd.DataFrame(), pd.DataFrame(), "", fmt='xlsx')
+    
+    @pytest.mark.parametrize("orjson_installed", [True, False])
+    def test_write_json_numpy_and_dataframe(self, orjson_installed, monkeypatch):
+        """Test JSON helper serializes numpy values, DataFrames and NaN the same with or without orjson."""
+        import json
+        import sys
+        
+        if orjson_installed:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setitem(sys.modules, "orjson", None)
+        
+        data = {
+            'matrix': np.eye(2),
+            'score': np.float32(0.5),
+            'count': np.int64(3),
+            'table': pd.DataFrame({'model': ['a', 'b'], 'score': [0.1, 0.2]}),
+            'missing': [float('nan'), np.float64('nan'), np.array([np.nan, 1.0])],
+            'missing_table': pd.DataFrame({'model': ['a'], 'score': [np.nan]})
+        }
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / 'out.json'
+            write_json(data, path)
+            
+            with open(path) as f:
+                loaded = json.load(f)
+        
+        assert loaded == {
+            'matrix': [[1.0, 0.0], [0.0, 1.0]],
+            'score': 0.5,
+            'count': 3,
+            'table': [{'model': 'a', 'score': 0.1}, {'model': 'b', 'score': 0.2}],
+            'missing': [None, None, [None, 1.0]],
+            'missing_table': [{'model': 'a', 'score': None}]
+        }
+
+
 if __name__ == '__main__':
     pytest.main([__file__])
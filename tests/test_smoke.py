@@ -58,6 +58,18 @@ def test_scorer_auc():
     assert 0 <= score <= 1
 
 
+def test_scorer_auc_matches_sklearn_with_ties():
+    """Test AUC scorer agrees with sklearn, including tied scores."""
+    from sklearn.metrics import roc_auc_score
+    
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 2, 1000)
+    y_pred = rng.random(1000).round(2).astype(np.float32)
+    
+    score = Scorer('auc').score(y_true, y_pred)
+    assert score == pytest.approx(roc_auc_score(y_true, y_pred), abs=1e-12)
+
+
 def test_scorer_mse():
     """Test MSE scorer."""
     scorer = Scorer('mse')
@@ -69,6 +81,17 @@ def test_scorer_mse():
     assert score <= 0  # Negative MSE for maximization
 
 
+@pytest.mark.parametrize("metric", ["mse", "mae"])
+def test_scorer_regression_rejects_invalid_input(metric):
+    """Test regression scorers raise on NaN and length mismatches like sklearn."""
+    scorer = Scorer(metric)
+    
+    with pytest.raises(ValueError, match="NaN"):
+        scorer.score(np.array([0., 1.]), np.array([np.nan, 1.]))
+    with pytest.raises(ValueError, match="inconsistent"):
+        scorer.score(np.array([0., 1.]), np.array([0., 1., 2.]))
+
+
 def test_mean_blend(sample_sub_data):
     """Test mean blending."""
     result = mean_blend(sample_sub_data)
@@ -108,6 +131,26 @@ def test_logit_mean_blend(sample_sub_data):
     assert result['pred'].max() <= 1
 
 
+def test_blend_predictions_shares_rank_transform(sample_sub_data, monkeypatch):
+    """Test rank transform is computed once and matches the single-method blends."""
+    from crediblend.core import blend as blend_module
+    from crediblend.core.blend import stack_predictions, blend_predictions
+    
+    calls = []
+    rank_space = blend_module._SPACE_TRANSFORMS['rank']
+    monkeypatch.setitem(blend_module._SPACE_TRANSFORMS, 'rank',
+                        lambda m: calls.append(1) or rank_space(m))
+    
+    tensors = stack_predictions(sample_sub_data)
+    results = blend_predictions(tensors, {}, ['mean', 'rank_mean', 'logit_mean'])
+    blend_predictions(tensors, {}, ['rank_mean'])
+    
+    assert len(calls) == 1
+    np.testing.assert_allclose(results['mean']['pred'], mean_blend(sample_sub_data)['pred'])
+    np.testing.assert_allclose(results['rank_mean']['pred'], rank_mean_blend(sample_sub_data)['pred'])
+    np.testing.assert_allclose(results['logit_mean']['pred'], logit_mean_blend(sample_sub_data)['pred'])
+
+
 def test_compute_oof_metrics(sample_oof_data):
     """Test OOF metrics computation."""
     scorer = Scorer('auc')
@@ -123,6 +166,29 @@ def test_compute_oof_metrics(sample_oof_data):
         assert isinstance(model_metrics['overall_oof'], (float, type(np.nan)))
 
 
+def test_compute_correlation_matrix_matches_spearman():
+    """Test vectorized correlation matrix against pairwise Spearman."""
+    from scipy.stats import spearmanr
+    from crediblend.core.decorrelate import compute_correlation_matrix
+    
+    rng = np.random.default_rng(0)
+    base = rng.random(500)
+    oof_data = {
+        f'model{k}': pd.DataFrame({
+            'id': range(500),
+            'pred': (base + rng.random(500) * k).round(2),
+            'target': rng.integers(0, 2, 500)
+        })
+        for k in range(1, 4)
+    }
+    
+    corr = compute_correlation_matrix(oof_data)
+    expected, _ = spearmanr(np.column_stack([df['pred'] for df in oof_data.values()]))
+    
+    assert list(corr.index) == list(oof_data.keys())
+    np.testing.assert_allclose(corr.values, expected, atol=1e-12)
+
+
 def test_align_submission_ids():
     """Test submission ID alignment."""
     sub_data = {
@@ -139,6 +205,36 @@ def test_align_submission_ids():
     assert set(aligned['model2']['id']) == {2, 3}
 
 
+def test_align_submission_ids_unordered():
+    """Test alignment sorts by ID and keeps row values and column order."""
+    sub_data = {
+        'model1': pd.DataFrame({'pred': [0.3, 0.1, 0.2], 'id': [3, 1, 2]}),
+        'model2': pd.DataFrame({'id': [2, 1, 3, 1], 'pred': [0.5, 0.4, 0.6, 0.4]}),
+    }
+    
+    with pytest.warns(UserWarning, match="ID mismatch"):
+        aligned = align_submission_ids({**sub_data, 'model3': pd.DataFrame({'id': [1, 2], 'pred': [0.7, 0.8]})})
+    
+    assert list(aligned['model1'].columns) == ['pred', 'id']
+    assert aligned['model1']['id'].tolist() == [1, 2]
+    assert aligned['model1']['pred'].tolist() == [0.1, 0.2]
+    # Duplicate IDs are kept, as before
+    assert aligned['model2']['id'].tolist() == [1, 1, 2]
+
+
+def test_align_submission_ids_already_aligned():
+    """Test identical sorted IDs are returned without realignment."""
+    sub_files = {
+        'sub_a': pd.DataFrame({'id': [1, 2, 3], 'pred': [0.1, 0.2, 0.3]}),
+        'sub_b': pd.DataFrame({'id': [1, 2, 3], 'pred': [0.4, 0.5, 0.6]})
+    }
+    
+    aligned = align_submission_ids(sub_files)
+    
+    assert aligned['sub_a'] is sub_files['sub_a']
+    assert aligned['sub_b'] is sub_files['sub_b']
+
+
 def test_generate_report(sample_oof_data, sample_sub_data):
     """Test HTML report generation."""
     scorer = Scorer('auc')
@@ -214,5 +310,133 @@ def test_integration_with_temp_files():
         assert 'sub_modelA' in sub_files
 
 
+def test_read_files_float32_predictions():
+    """Test prediction and fold columns are downcast while ids and targets are kept."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pd.DataFrame({
+            'id': [1, 2, 3, 4],
+            'pred': [0.65, 0.32, 0.78, 0.45],
+            'target': [1.0, 0.0, 1.0, 0.0],
+            'fold': [0, 0, 1, 1]
+        }).to_csv(Path(temp_dir) / "oof_modelA.csv", index=False)
+        
+        oof_files = read_oof_files(temp_dir, dtype='float32')
+        df = oof_files['oof_modelA']
+        
+        assert df['pred'].dtype == np.float32
+        assert df['target'].dtype == np.float64
+        assert df['id'].dtype == np.int64
+        assert isinstance(df['fold'].dtype, pd.CategoricalDtype)
+        assert df['fold'].cat.codes.dtype == np.int8
+
+
+@pytest.mark.parametrize('engine', ['pyarrow', 'polars'])
+def test_read_files_engine(engine):
+    """Test the pyarrow/polars CSV engines match pandas and drop unused columns."""
+    pytest.importorskip(engine)
+    # polars hands frames to pandas through pyarrow
+    pytest.importorskip("pyarrow")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        oof_data = pd.DataFrame({
+            'id': [1, 2, 3, 4, 5],
+            'pred': [0.65, 0.32, 0.78, 0.45, 0.89],
+            'target': [1, 0, 1, 0, 1],
+            'fold': [0, 0, 1, 1, 1]
+        })
+        oof_data.to_csv(Path(temp_dir) / "oof_modelA.csv", index=False)
+        sub_data = pd.DataFrame({'id': [1, 2], 'pred': [0.1, 0.9], 'note': ['a', 'b']})
+        sub_data.to_csv(Path(temp_dir) / "sub_modelA.csv", index=False)
+        # Header probe must see 'id', not '\ufeffid'
+        (Path(temp_dir) / "sub_modelB.csv").write_bytes(b'\xef\xbb\xbfid,pred\n1,0.1\n2,0.9\n')
+        
+        pandas_files = read_oof_files(temp_dir, engine='pandas')
+        engine_files = read_oof_files(temp_dir, engine=engine)
+        engine_subs = read_sub_files(temp_dir, engine=engine)
+        
+        pd.testing.assert_frame_equal(pandas_files['oof_modelA'], engine_files['oof_modelA'])
+        assert list(engine_subs['sub_modelA'].columns) == ['id', 'pred']
+        assert list(engine_subs['sub_modelB'].columns) == ['id', 'pred']
+
+
+def test_read_files_sorted_order():
+    """Test files are returned in sorted filename order regardless of directory order."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for name in ('sub_c', 'sub_a', 'sub_b'):
+            pd.DataFrame({'id': [1, 2], 'pred': [0.1, 0.9]}).to_csv(Path(temp_dir) / f"{name}.csv", index=False)
+        
+        sub_files = read_sub_files(temp_dir)
+        
+        assert list(sub_files) == ['sub_a', 'sub_b', 'sub_c']
+
+
+def test_read_files_memory_mapped(monkeypatch):
+    """Test memory-mapped reads of large files match buffered reads."""
+    pytest.importorskip("pyarrow")
+    from crediblend.core import io as io_module
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        oof_data = pd.DataFrame({
+            'id': [1, 2, 3, 4, 5],
+            'pred': [0.65, 0.32, 0.78, 0.45, 0.89],
+            'target': [1, 0, 1, 0, 1]
+        })
+        oof_data.to_csv(Path(temp_dir) / "oof_modelA.csv", index=False)
+        
+        buffered = {engine: read_oof_files(temp_dir, engine=engine) for engine in ('pandas', 'pyarrow')}
+        monkeypatch.setattr(io_module, '_MMAP_THRESHOLD', 0)
+        for engine, files in buffered.items():
+            mapped = read_oof_files(temp_dir, engine=engine)
+            pd.testing.assert_frame_equal(files['oof_modelA'], mapped['oof_modelA'])
+
+
+def test_read_files_parquet_cache(monkeypatch):
+    """Test cached reads skip CSV parsing until the file changes."""
+    pytest.importorskip("pyarrow")
+    import crediblend.core.io as io_module
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        sub_dir = Path(temp_dir) / "sub"
+        cache_dir = Path(temp_dir) / "cache"
+        sub_dir.mkdir()
+        
+        sub_path = sub_dir / "sub_modelA.csv"
+        pd.DataFrame({'id': [1, 2, 3], 'pred': [0.1, 0.2, 0.3]}).to_csv(sub_path, index=False)
+        
+        first = read_sub_files(str(sub_dir), cache_dir=str(cache_dir))
+        assert len(list(cache_dir.glob("*.parquet"))) == 1
+        
+        def fail_read(*args, **kwargs):
+            raise AssertionError("CSV parsed despite cache hit")
+        
+        with monkeypatch.context() as m:
+            m.setattr(io_module, "read_csv_file", fail_read)
+            cached = read_sub_files(str(sub_dir), cache_dir=str(cache_dir))
+        pd.testing.assert_frame_equal(first['sub_modelA'], cached['sub_modelA'])
+        
+        # Changing the file invalidates the entry
+        pd.DataFrame({'id': [1, 2], 'pred': [0.5, 0.6]}).to_csv(sub_path, index=False)
+        updated = read_sub_files(str(sub_dir), cache_dir=str(cache_dir))
+        assert len(updated['sub_modelA']) == 2
+        assert len(list(cache_dir.glob("*.parquet"))) == 1
+
+
+def test_search_param_type():
+    """Test --search values are parsed into typed params and malformed input is rejected."""
+    import click
+    from crediblend.cli import SearchParamType
+    
+    param_type = SearchParamType()
+    assert param_type.convert('backend=optuna, iters=50,jobs=-1', None, None) == {
+        'backend': 'optuna', 'iters': 50, 'jobs': -1
+    }
+    
+    with pytest.raises(click.BadParameter):
+        param_type.convert('iters=many', None, None)
+    for bad in ('restarts', 'iter=50', 'backend=grid', 'restarts=0', 'iters=-5'):
+        with pytest.raises(click.BadParameter):
+            param_type.convert(bad, None, None)
+
+
 if __name__ == '__main__':
     pytest.main([__file__])
@@ -107,6 +107,39 @@ def test_compute_windowed_metrics(sample_time_oof_data):
     assert all(0 <= auc <= 1 for auc in window_metrics['auc'] if not pd.isna(auc))
 
 
+def test_compute_windowed_metrics_matches_generic_metric(sample_time_oof_data):
+    """Test jitted windowed AUC agrees with calling the metric per window."""
+    scorer = Scorer('auc')
+    fast = compute_windowed_metrics(sample_time_oof_data, 'date', 'W', 'target', scorer.score)
+    generic = compute_windowed_metrics(
+        sample_time_oof_data, 'date', 'W', 'target', lambda y, p: scorer.score(y, p)
+    )
+    
+    pd.testing.assert_frame_equal(fast, generic)
+
+
+def test_compute_windowed_metrics_keeps_nan_values(sample_time_oof_data):
+    """Test windows whose metric returns NaN are recorded, not dropped."""
+    from sklearn.metrics import roc_auc_score
+    
+    constant = compute_windowed_metrics(
+        sample_time_oof_data, 'date', 'W', 'target', lambda y, p: 0.5
+    )
+    nan_metrics = compute_windowed_metrics(
+        sample_time_oof_data, 'date', 'W', 'target', lambda y, p: np.nan
+    )
+    
+    assert len(nan_metrics) == len(constant)
+    assert nan_metrics['auc'].isna().all()
+    
+    # sklearn's AUC is NaN for single-class windows; the jitted path keeps those rows too
+    generic = compute_windowed_metrics(
+        sample_time_oof_data, 'date', 'W', 'target', lambda y, p: roc_auc_score(y, p)
+    )
+    fast = compute_windowed_metrics(sample_time_oof_data, 'date', 'W', 'target', roc_auc_score)
+    pd.testing.assert_frame_equal(fast, generic)
+
+
 def test_compute_windowed_metrics_missing_target():
     """Test windowed metrics with missing target column."""
     dates = pd.date_range('2023-01-01', periods=10, freq='D')
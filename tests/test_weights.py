@@ -109,6 +109,10 @@ def test_weight_optimizer_parallel():
     assert isinstance(score, float)
     assert 'n_restarts' in opt_info
     assert 'best_score' in opt_info
+    
+    # Like the file readers, max_workers below 1 means all cores
+    weights, _, _ = optimizer.optimize_parallel(X, y, n_restarts=2, max_workers=0)
+    assert np.isclose(np.sum(weights), 1.0, atol=1e-6)
 
 
 def test_optimize_weights(sample_oof_data, sample_sub_data):
@@ -136,6 +140,24 @@ def test_optimize_weights(sample_oof_data, sample_sub_data):
     assert np.isclose(total_weight, 1.0, atol=1e-6)
 
 
+def test_optimize_weights_optuna_backend(sample_oof_data, sample_sub_data):
+    """Test weight optimization with the Optuna backend."""
+    pytest.importorskip("optuna")
+    scorer = Scorer('auc')
+    
+    result_df, weight_info = optimize_weights(
+        sample_oof_data, sample_sub_data, scorer,
+        random_state=42, backend='optuna', n_iters=20
+    )
+    
+    assert len(result_df) == 5
+    assert weight_info['optimization_info']['backend'] == 'optuna'
+    assert np.isclose(sum(weight_info['weights'].values()), 1.0, atol=1e-6)
+    
+    with pytest.raises(ValueError):
+        optimize_weights(sample_oof_data, sample_sub_data, scorer, backend='grid')
+
+
 def test_validate_weights():
     """Test weight validation."""
     scorer = Scorer('auc')